@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Lastmilefirst Overwatch - Git Status
+Shared, cached `git status` for the SessionStart and Stop hooks.
+
+Tracked changes come from `git status --untracked-files=no`, which stays fast
+in repos with huge untracked trees. Untracked files are counted by a separate
+probe that stops after UNTRACKED_PROBE_LIMIT entries or UNTRACKED_PROBE_SECONDS.
+Repos with core.fsmonitor or core.untrackedCache enabled get a single full
+`git status`, since git can already answer the untracked part cheaply there.
+
+Results are cached per repository in git-status-cache.json, keyed by HEAD and
+the index's mtime/size, so hooks that fire back to back reuse one status run.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+# Add script directory to path for local imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from overwatch import get_state_dir
+
+GIT_TIMEOUT_SECONDS = 5
+UNTRACKED_PROBE_LIMIT = 1000
+UNTRACKED_PROBE_SECONDS = 2.0
+CACHE_TTL_SECONDS = 60
+MAX_CACHED_REPOS = 50
+PATHSPEC_BATCH = 200  # Paths per `git status -- <paths>` call, well under ARG_MAX
+
+
+class GitStatus(NamedTuple):
+    """Uncommitted changes in one repository."""
+    root: str
+    changed: List[str]       # Porcelain lines for tracked changes
+    untracked: List[str]     # Untracked paths (directories collapsed), possibly truncated
+    untracked_complete: bool
+    checked_at: int
+
+    @property
+    def count(self) -> int:
+        return len(self.changed) + len(self.untracked)
+
+    def describe(self) -> str:
+        """Human-readable file count, e.g. '12' or '1000+'."""
+        return f"{self.count}" if self.untracked_complete else f"{self.count}+"
+
+
+def get_cache_file() -> Path:
+    """Get the path to the git status cache."""
+    return get_state_dir() / "git-status-cache.json"
+
+
+def _git(args: List[str], cwd: Optional[str], timeout: float = GIT_TIMEOUT_SECONDS) -> subprocess.CompletedProcess:
+    # --no-optional-locks: never contend with the user's own git commands for index.lock
+    return subprocess.run(
+        ["git", "--no-optional-locks", *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+
+
+def _locate_repo(cwd: Optional[str]) -> Optional[Tuple[str, str, str]]:
+    """Return (toplevel, git dir, HEAD oid) in one rev-parse, or None outside a repo."""
+    result = _git(["rev-parse", "--show-toplevel", "--absolute-git-dir", "--verify", "-q", "HEAD"], cwd)
+    lines = result.stdout.splitlines()
+    if len(lines) < 2:
+        return None  # Not a repository (or a bare one)
+    head = lines[2] if result.returncode == 0 and len(lines) > 2 else ""  # "" = unborn branch
+    return lines[0], lines[1], head
+
+
+def _cache_key(git_dir: str, head: str) -> List[Any]:
+    try:
+        st = os.stat(os.path.join(git_dir, "index"))
+    except OSError:
+        return [head, 0, 0]  # No index yet (fresh repo)
+    return [head, st.st_mtime_ns, st.st_size]
+
+
+def _load_cache() -> Dict[str, Any]:
+    try:
+        with open(get_cache_file(), encoding="utf-8") as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _save_cache(cache: Dict[str, Any]) -> None:
+    if len(cache) > MAX_CACHED_REPOS:
+        newest = sorted(cache, key=lambda k: cache[k].get("checked_at", 0), reverse=True)
+        cache = {k: cache[k] for k in newest[:MAX_CACHED_REPOS]}
+
+    cache_file = get_cache_file()
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        tmp_file.unlink(missing_ok=True)
+
+
+def _fast_untracked(cwd: str) -> bool:
+    """Check whether git can list untracked files cheaply (fsmonitor / untracked cache)."""
+    result = _git(["config", "--get-regexp", r"^core\.(fsmonitor|untrackedcache)$"], cwd)
+    for line in result.stdout.splitlines():
+        _, _, value = line.partition(" ")
+        if value.strip().lower() not in ("", "false", "no", "off", "0"):
+            return True
+    return False
+
+
+def _probe_untracked(cwd: str, limit: int, seconds: float) -> Tuple[List[str], bool]:
+    """List up to `limit` untracked paths, giving up after `seconds`. Returns (paths, complete)."""
+    try:
+        proc = subprocess.Popen(
+            [
+                "git", "--no-optional-locks", "ls-files",
+                # Same entries as `git status`: untracked dirs collapsed, empty dirs left out
+                "--others", "--exclude-standard", "--directory", "--no-empty-directory",
+            ],
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+    except OSError:
+        return [], False
+
+    # Kill git if it walks the tree for too long; readline then sees EOF
+    watchdog = threading.Timer(seconds, proc.kill)
+    watchdog.daemon = True
+    watchdog.start()
+
+    paths: List[str] = []
+    complete = True
+    try:
+        for line in proc.stdout:
+            if len(paths) >= limit:
+                complete = False
+                break
+            paths.append(line.rstrip("\n"))
+    finally:
+        watchdog.cancel()
+        if proc.poll() is None:
+            proc.kill()
+        proc.stdout.close()
+        proc.wait()
+
+    if proc.returncode != 0:
+        complete = False  # Killed by the watchdog (or git failed)
+    return paths, complete
+
+
+def run_status(root: str) -> Optional[Tuple[List[str], List[str], bool]]:
+    """Run git status for `root`. Returns (changed, untracked, untracked_complete)."""
+    if _fast_untracked(root):
+        result = _git(["status", "--porcelain"], root)
+        if result.returncode != 0:
+            return None
+        changed, untracked = [], []
+        for line in result.stdout.splitlines():
+            if line.startswith("?? "):
+                untracked.append(line[3:])
+            elif line:
+                changed.append(line)
+        return changed, untracked, True
+
+    result = _git(["status", "--porcelain", "--untracked-files=no"], root)
+    if result.returncode != 0:
+        return None
+    changed = [line for line in result.stdout.splitlines() if line]
+    untracked, complete = _probe_untracked(root, UNTRACKED_PROBE_LIMIT, UNTRACKED_PROBE_SECONDS)
+    return changed, untracked, complete
+
+
+def get_status(
+    cwd: Optional[str] = None,
+    max_age: Optional[float] = CACHE_TTL_SECONDS,
+    not_before: float = 0.0,
+) -> Optional[GitStatus]:
+    """
+    Uncommitted changes for the repository containing `cwd`.
+
+    A cached result is reused when HEAD and the index are unchanged, it is at
+    most `max_age` seconds old (None = no age limit) and it was taken after
+    `not_before` (e.g. the time of the last recorded edit).
+    Returns None outside a git repo, or when git is missing or too slow.
+    """
+    try:
+        repo = _locate_repo(cwd)
+        if repo is None:
+            return None
+        root, git_dir, head = repo
+
+        key = _cache_key(git_dir, head)
+        now = time.time()
+        cache = _load_cache()
+        entry = cache.get(git_dir)
+        if entry and entry.get("key") == key:
+            checked_at = entry.get("checked_at", 0)
+            if checked_at >= not_before and (max_age is None or now - checked_at <= max_age):
+                return GitStatus(
+                    root,
+                    entry.get("changed", []),
+                    entry.get("untracked", []),
+                    entry.get("untracked_complete", True),
+                    checked_at,
+                )
+
+        status = run_status(root)
+        if status is None:
+            return None
+        changed, untracked, complete = status
+
+        checked_at = int(now)
+        cache[git_dir] = {
+            "key": key,
+            "checked_at": checked_at,
+            "changed": changed,
+            "untracked": untracked,
+            "untracked_complete": complete,
+        }
+        _save_cache(cache)
+        return GitStatus(root, changed, untracked, complete, checked_at)
+
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return None  # Git not available or too slow
+
+
+def find_repo_root(path: str, _seen: Optional[Dict[str, Optional[str]]] = None) -> Optional[str]:
+    """Nearest ancestor directory of `path` containing .git (no subprocess)."""
+    seen = {} if _seen is None else _seen
+    walked = []
+    current = os.path.dirname(os.path.abspath(path))
+    root: Optional[str] = None
+    while True:
+        if current in seen:
+            root = seen[current]
+            break
+        walked.append(current)
+        if os.path.exists(os.path.join(current, ".git")):
+            root = current
+            break
+        parent = os.path.dirname(current)
+        if parent == current:
+            break
+        current = parent
+    for directory in walked:
+        seen[directory] = root
+    return root
+
+
+def _parse_porcelain_z(output: str) -> List[str]:
+    """Split `git status --porcelain -z` output into "XY path" entries."""
+    entries: List[str] = []
+    fields = iter(output.split("\0"))
+    for field in fields:
+        if len(field) < 4:
+            continue
+        entries.append(field)
+        if "R" in field[:2] or "C" in field[:2]:
+            next(fields, None)  # Rename/copy source follows as its own field
+    return entries
+
+
+def get_path_status(paths: List[str]) -> Dict[str, List[str]]:
+    """
+    Uncommitted changes limited to `paths`, grouped by repository root.
+
+    Runs `git status --porcelain -z -- <paths>` per repository in batches of
+    PATHSPEC_BATCH, so the cost follows the number of paths, not the repo size.
+    Paths are matched literally, never as globs. Returns {root: ["XY path"]}
+    for repos with changes, with paths relative to the root and unquoted
+    (the new name for renames); paths outside a repo, and repos where git
+    fails or times out, are left out.
+    """
+    by_repo: Dict[str, List[str]] = {}
+    seen: Dict[str, Optional[str]] = {}
+    for path in dict.fromkeys(paths):
+        root = find_repo_root(path, seen)
+        if root is not None:
+            by_repo.setdefault(root, []).append(path)
+
+    changes: Dict[str, List[str]] = {}
+    for root, repo_paths in by_repo.items():
+        lines: List[str] = []
+        try:
+            for i in range(0, len(repo_paths), PATHSPEC_BATCH):
+                batch = repo_paths[i:i + PATHSPEC_BATCH]
+                result = _git(
+                    ["--literal-pathspecs", "status", "--porcelain", "-z", "--untracked-files=all", "--", *batch],
+                    root,
+                )
+                if result.returncode != 0:
+                    break
+                lines.extend(_parse_porcelain_z(result.stdout))
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            pass  # Report what we have for this repo
+        if lines:
+            changes[root] = lines
+    return changes
+
+
+if __name__ == "__main__":
+    # Quick test
+    start = time.monotonic()
+    status = get_status(max_age=0)
+    elapsed = (time.monotonic() - start) * 1000
+    if status is None:
+        print("Not a git repository")
+    else:
+        print(f"Repo: {status.root}")
+        print(f"Tracked changes: {len(status.changed)}")
+        print(f"Untracked: {len(status.untracked)}{'' if status.untracked_complete else '+ (probe truncated)'}")
+        print(f"Fresh status: {elapsed:.1f}ms")
+        start = time.monotonic()
+        get_status()
+        print(f"Cached status: {(time.monotonic() - start) * 1000:.1f}ms")
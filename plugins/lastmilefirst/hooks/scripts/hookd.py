@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Lastmilefirst Overwatch - Hook Daemon
+Long-lived process that runs hook scripts in-process over a unix socket,
+so a hook event costs one short client startup instead of two interpreters.
+
+Opt-in: set LASTMILEFIRST_HOOK_DAEMON=1. run.py starts the daemon lazily on
+first use and runs the script itself whenever the daemon is unavailable.
+The daemon exits after IDLE_TIMEOUT_SECONDS without requests.
+
+Usage: hookd.py <serve|status|stop>
+"""
+
+import io
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add script directory to path for local imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from overwatch import get_state_dir, file_lock
+from run import DAEMON_ENV, SCRIPT_TIMEOUT_SECONDS, run_with_timeout
+
+IDLE_TIMEOUT_SECONDS = 1800  # 30 minutes
+CONNECT_TIMEOUT_SECONDS = 1.0
+SCRIPT_ROOT = str(Path(__file__).resolve().parent)
+
+
+def get_socket_path() -> Path:
+    """Get the path to the daemon's unix socket."""
+    return get_state_dir() / "hookd.sock"
+
+
+def daemon_enabled() -> bool:
+    """Check whether the user opted in and the platform supports unix sockets."""
+    return os.environ.get(DAEMON_ENV) == "1" and hasattr(socket, "AF_UNIX")
+
+
+def _send_json(conn: socket.socket, payload: Dict[str, Any]) -> None:
+    conn.sendall(json.dumps(payload).encode("utf-8"))
+    conn.shutdown(socket.SHUT_WR)
+
+
+def _recv_json(conn: socket.socket) -> Dict[str, Any]:
+    chunks = []
+    while True:
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    return json.loads(b"".join(chunks).decode("utf-8"))
+
+
+def _roundtrip(payload: Dict[str, Any], timeout: float) -> Optional[Dict[str, Any]]:
+    """Send one request to the daemon. Returns None if it is not reachable."""
+    sock_path = get_socket_path()
+    if not sock_path.exists():
+        return None
+
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.settimeout(CONNECT_TIMEOUT_SECONDS)
+        conn.connect(str(sock_path))
+        conn.settimeout(timeout)
+        _send_json(conn, payload)
+        return _recv_json(conn)
+    except (OSError, ValueError):
+        return None
+    finally:
+        conn.close()
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+def call(script_path: Path, args: List[str], stdin_data: str) -> Optional[int]:
+    """
+    Run a hook script inside the daemon.
+
+    Replays the script's stdout/stderr locally and returns its exit code,
+    or None if the daemon is absent, stale or unreachable.
+    """
+    response = _roundtrip(
+        {
+            "op": "run",
+            "root": SCRIPT_ROOT,
+            "script": str(script_path.resolve()),
+            "args": args,
+            "cwd": os.getcwd(),
+            "env": dict(os.environ),
+            "stdin": stdin_data,
+        },
+        timeout=SCRIPT_TIMEOUT_SECONDS + 5,
+    )
+    if response is None or "returncode" not in response:
+        return None
+
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    return int(response["returncode"])
+
+
+def spawn() -> None:
+    """Start the daemon in the background, detached from the hook process."""
+    try:
+        subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "serve"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+            close_fds=True,
+        )
+    except OSError:
+        pass  # Daemon is an optimization - never fail the hook over it
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+def _run_request(request: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Execute one hook script with the client's cwd, env, argv and stdin.
+
+    Sets "retire" in the response when the daemon must not serve another
+    request: the script hung, or it left threads running (e.g. session-start
+    checks past their deadline) that would see the next request's env, cwd
+    and redirected output.
+    """
+    out, err = io.StringIO(), io.StringIO()
+    threads_before = set(threading.enumerate())
+    saved_cwd = os.getcwd()
+    saved_env = dict(os.environ)
+    saved_stdin = sys.stdin
+    returncode: Optional[int] = 1
+
+    try:
+        os.chdir(request.get("cwd") or saved_cwd)
+        os.environ.clear()
+        os.environ.update(request.get("env") or saved_env)
+        sys.stdin = io.StringIO(request.get("stdin", ""))
+
+        with redirect_stdout(out), redirect_stderr(err):
+            returncode = run_with_timeout(
+                Path(request["script"]), request.get("args", []), SCRIPT_TIMEOUT_SECONDS
+            )
+
+        if returncode is None:
+            # The hung thread cannot be killed; report and let serve() exit
+            err.write(f"Script timed out: {request['script']}\n")
+            return {"returncode": 1, "stdout": out.getvalue(), "stderr": err.getvalue(), "retire": True}
+
+        leftover = [t for t in threading.enumerate() if t not in threads_before and t.is_alive()]
+        if leftover:
+            return {"returncode": returncode, "stdout": out.getvalue(), "stderr": err.getvalue(), "retire": True}
+
+    except OSError as e:
+        err.write(f"Error running script: {e}\n")
+        returncode = 1
+    finally:
+        sys.stdin = saved_stdin
+        os.environ.clear()
+        os.environ.update(saved_env)
+        try:
+            os.chdir(saved_cwd)
+        except OSError:
+            pass
+
+    return {"returncode": returncode, "stdout": out.getvalue(), "stderr": err.getvalue()}
+
+
+def serve(idle_timeout: int = IDLE_TIMEOUT_SECONDS) -> int:
+    """Accept hook requests until idle, stopped, or superseded by a newer plugin."""
+    sock_path = get_socket_path()
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    # Serialize startup so concurrent lazy spawns don't steal each other's socket
+    with file_lock(get_state_dir() / "hookd.lock"):
+        if _roundtrip({"op": "ping"}, timeout=CONNECT_TIMEOUT_SECONDS):
+            return 0  # Another daemon is already serving
+
+        sock_path.unlink(missing_ok=True)
+        old_umask = os.umask(0o077)
+        try:
+            server.bind(str(sock_path))
+        finally:
+            os.umask(old_umask)
+        server.listen(16)
+        sock_inode = sock_path.stat().st_ino
+
+    server.settimeout(idle_timeout)
+    try:
+        while True:
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                break
+
+            with conn:
+                conn.settimeout(SCRIPT_TIMEOUT_SECONDS)
+                try:
+                    request = _recv_json(conn)
+                except (OSError, ValueError):
+                    continue
+
+                op = request.get("op")
+                if op == "ping":
+                    _send_json(conn, {"ok": True, "pid": os.getpid(), "root": SCRIPT_ROOT})
+                    continue
+                if op == "stop":
+                    _send_json(conn, {"ok": True})
+                    break
+                if request.get("root") != SCRIPT_ROOT:
+                    # Plugin was updated; retire so the client spawns fresh code
+                    _send_json(conn, {"stale": True})
+                    break
+
+                response = _run_request(request)
+                _send_json(conn, response)
+                if response.get("retire"):
+                    break
+    finally:
+        server.close()
+        try:
+            if sock_path.stat().st_ino == sock_inode:
+                sock_path.unlink()
+        except OSError:
+            pass
+
+    return 0
+
+
+def main() -> int:
+    action = sys.argv[1] if len(sys.argv) > 1 else "status"
+
+    if not hasattr(socket, "AF_UNIX"):
+        print("Hook daemon requires unix socket support on this platform.", file=sys.stderr)
+        return 1
+
+    if action == "serve":
+        return serve()
+
+    if action == "status":
+        info = _roundtrip({"op": "ping"}, timeout=CONNECT_TIMEOUT_SECONDS)
+        if info:
+            print(f"Hook daemon running (pid {info.get('pid')}) at {get_socket_path()}")
+        else:
+            print("Hook daemon not running")
+        print(f"Enabled: {daemon_enabled()} (set {DAEMON_ENV}=1 to opt in)")
+        return 0
+
+    if action == "stop":
+        if _roundtrip({"op": "stop"}, timeout=CONNECT_TIMEOUT_SECONDS):
+            print("Hook daemon stopped")
+        else:
+            print("Hook daemon not running")
+        return 0
+
+    print(f"Unknown action: {action}")
+    print("Usage: hookd.py <serve|status|stop>")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,465 @@
+#!/usr/bin/env python3
+"""
+Lastmilefirst Overwatch - Invocation Log
+Daily-rotated segments of skill/agent invocations.
+
+Each UTC day gets its own `invocations/YYYY-MM-DD.bin` segment of
+struct-packed records (timestamp, duration, kind, skill/agent name, session
+id). The original single-file invocations.log is split into segments once,
+at the first session start after upgrading. Retention drops whole
+segments, so no reader or writer ever has to rewrite the log, and range
+queries only open the days they cover.
+
+Appends take no lock: each record is one os.write() of at most PIPE_BUF
+bytes to an O_APPEND descriptor, which the kernel never interleaves.
+The lock is only taken at session start, when closed days are compacted
+into usage-rollup.json (per-day per-name counters) and old data is pruned.
+Usage stats therefore read O(days) counters plus today's raw segment.
+
+Set LASTMILEFIRST_RAW_INVOCATIONS=0 to skip the raw log; appends then
+update the counters directly, under the lock.
+
+Run `invocations.py stress [WRITERS] [RECORDS]` to check that concurrent
+appends never interleave.
+
+With LASTMILEFIRST_STORE=sqlite the same functions read and write indexed
+rows in overwatch.db instead (see sqlite_store.py).
+"""
+
+import json
+import os
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+# Add script directory to path for local imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from overwatch import (
+    get_invocations_dir,
+    get_invocations_file,
+    get_lock_file,
+    get_usage_rollup_file,
+    file_lock,
+    use_sqlite_store,
+)
+
+RETENTION_DAYS = 30
+ROLLUP_RETENTION_DAYS = 365  # Counters are tiny; keep a year
+SEGMENT_SUFFIX = ".bin"
+RAW_LOG_ENV = "LASTMILEFIRST_RAW_INVOCATIONS"
+MAX_RECORD_BYTES = 512  # POSIX minimum PIPE_BUF; single writes this small are atomic
+
+# Binary record: magic byte, timestamp, duration_ms (u32), kind, name length,
+# session id length (u8), then the UTF-8 name and session id. At most 331
+# bytes. The magic byte lets readers resync after a torn record.
+RECORD_MAGIC = 0xA5
+RECORD_HEADER = struct.Struct("<BIIBBB")
+MAX_NAME_BYTES = 255
+MAX_SESSION_BYTES = 64
+KINDS = ("", "skill", "agent")
+
+
+class InvocationRecord(NamedTuple):
+    """One logged skill/agent invocation."""
+
+    timestamp: int
+    name: str
+    kind: str = ""
+    duration_ms: int = 0
+    session_id: str = ""
+
+
+def segment_day(timestamp: int) -> str:
+    """UTC day (YYYY-MM-DD) a timestamp belongs to."""
+    return time.strftime("%Y-%m-%d", time.gmtime(timestamp))
+
+
+def get_segment_file(timestamp: int) -> Path:
+    """Get the segment file covering a timestamp."""
+    return get_invocations_dir() / f"{segment_day(timestamp)}{SEGMENT_SUFFIX}"
+
+
+def list_segments(since: int = 0) -> List[Path]:
+    """List segment files covering `since` onwards, oldest first."""
+    first_day = segment_day(since)
+    segments = []
+    for path in get_invocations_dir().iterdir():
+        if path.suffix != SEGMENT_SUFFIX:
+            continue
+        # ISO dates compare correctly as strings
+        if path.stem >= first_day:
+            segments.append(path)
+    return sorted(segments)
+
+
+def raw_log_enabled() -> bool:
+    """Whether raw invocation lines are written in addition to the counters."""
+    return os.environ.get(RAW_LOG_ENV, "1") != "0"
+
+
+def _empty_rollup() -> Dict[str, Any]:
+    # Raw segments for days after compacted_through are not yet in "days"
+    return {"last": 0, "compacted_through": "", "days": {}}
+
+
+def _load_rollup_unlocked() -> Dict[str, Any]:
+    """Load the counters. Safe without the lock since writers replace atomically."""
+    rollup_file = get_usage_rollup_file()
+    if not rollup_file.exists():
+        return _empty_rollup()
+
+    try:
+        with open(rollup_file, encoding='utf-8') as f:
+            rollup = json.load(f)
+        if not isinstance(rollup.get("days"), dict):
+            return _empty_rollup()
+        return rollup
+    except (json.JSONDecodeError, IOError):
+        return _empty_rollup()
+
+
+def _save_rollup_unlocked(rollup: Dict[str, Any]) -> None:
+    """Write the counters via rename so readers never see a partial file."""
+    rollup_file = get_usage_rollup_file()
+    tmp_file = rollup_file.with_suffix(".tmp")
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(rollup, f, separators=(",", ":"))
+    os.replace(tmp_file, rollup_file)
+
+
+def _count(rollup: Dict[str, Any], timestamp: int, name: str, n: int = 1) -> None:
+    day = rollup["days"].setdefault(segment_day(timestamp), {})
+    day[name] = day.get(name, 0) + n
+    rollup["last"] = max(rollup.get("last", 0), timestamp)
+
+
+def _truncate(text: str, max_bytes: int) -> bytes:
+    # Cut on a character boundary
+    return text.encode("utf-8")[:max_bytes].decode("utf-8", errors="ignore").encode("utf-8")
+
+
+def _encode_record(record: InvocationRecord) -> bytes:
+    """Pack one record; always well under MAX_RECORD_BYTES."""
+    name = _truncate(record.name, MAX_NAME_BYTES)
+    session_id = _truncate(record.session_id, MAX_SESSION_BYTES)
+    kind = KINDS.index(record.kind) if record.kind in KINDS else 0
+    header = RECORD_HEADER.pack(
+        RECORD_MAGIC,
+        record.timestamp & 0xFFFFFFFF,
+        min(max(record.duration_ms, 0), 0xFFFFFFFF),
+        kind,
+        len(name),
+        len(session_id),
+    )
+    return header + name + session_id
+
+
+def _decode_at(data: bytes, offset: int) -> Optional[Tuple[InvocationRecord, int]]:
+    """Decode the record at `offset` as (record, end), or None if it isn't a whole valid record."""
+    if offset + RECORD_HEADER.size > len(data):
+        return None
+    magic, ts, duration_ms, kind, name_len, session_len = RECORD_HEADER.unpack_from(data, offset)
+    if magic != RECORD_MAGIC or kind >= len(KINDS) or session_len > MAX_SESSION_BYTES:
+        return None
+    start = offset + RECORD_HEADER.size
+    end = start + name_len + session_len
+    # A torn record runs into the next one: valid records end where another begins
+    if end > len(data) or (end < len(data) and data[end] != RECORD_MAGIC):
+        return None
+    try:
+        name = data[start:start + name_len].decode("utf-8")
+        session_id = data[start + name_len:end].decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+    return InvocationRecord(ts, name, KINDS[kind], duration_ms, session_id), end
+
+
+def _decode_records(data: bytes, since: int) -> Iterator[InvocationRecord]:
+    """Decode a segment, skipping over torn or partial records to the next valid one."""
+    offset = 0
+    while offset < len(data):
+        decoded = _decode_at(data, offset)
+        if decoded is None:
+            offset = data.find(bytes([RECORD_MAGIC]), offset + 1)
+            if offset == -1:
+                return
+            continue
+        record, offset = decoded
+        if record.timestamp >= since:
+            yield record
+
+
+def _append_bytes(path: Path, data: bytes) -> None:
+    """Append with a single write() on an O_APPEND descriptor."""
+    flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+    fd = os.open(str(path), flags, 0o600)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def append_invocation(
+    name: str,
+    timestamp: Optional[int] = None,
+    kind: str = "",
+    duration_ms: int = 0,
+    session_id: str = "",
+) -> None:
+    """Record one invocation in today's segment (lock-free)."""
+    if timestamp is None:
+        timestamp = int(time.time())
+    record = InvocationRecord(timestamp, name, kind, duration_ms, session_id)
+
+    if use_sqlite_store():
+        import sqlite_store
+        sqlite_store.append_invocation(record)
+        return
+
+    if raw_log_enabled():
+        _append_bytes(get_segment_file(timestamp), _encode_record(record))
+        return
+
+    # No raw log to compact later: count directly
+    with file_lock(get_lock_file()):
+        rollup = _load_rollup_unlocked()
+        _count(rollup, timestamp, name)
+        _save_rollup_unlocked(rollup)
+
+
+def load_usage_counts(since: int = 0) -> Tuple[Dict[str, int], int]:
+    """
+    Sum per-name counts for the UTC days from `since` onwards.
+
+    Compacted days come from the counters; days not yet compacted (normally
+    just today) are counted from their raw segment. Day granularity: a day
+    that `since` falls in the middle of is left out, so "the last 7 days"
+    is today plus the 6 full days before it. Returns (counts by name,
+    timestamp of the most recent invocation).
+    """
+    # First UTC midnight at or after `since`
+    day_start = -(-since // 86400) * 86400
+
+    if use_sqlite_store():
+        import sqlite_store
+        return sqlite_store.usage_counts(day_start)
+
+    rollup = _load_rollup_unlocked()
+    first_day = segment_day(day_start)
+    counts: Dict[str, int] = {}
+    last = rollup.get("last", 0)
+
+    for day, day_counts in rollup["days"].items():
+        if day < first_day:
+            continue
+        for name, n in day_counts.items():
+            counts[name] = counts.get(name, 0) + n
+
+    for segment in list_segments(day_start):
+        if segment.stem <= rollup["compacted_through"]:
+            continue
+        for record in _parse_segment(segment, 0):
+            counts[record.name] = counts.get(record.name, 0) + 1
+            last = max(last, record.timestamp)
+
+    return counts, last
+
+
+def _parse_lines(path: Path, since: int) -> Iterator[InvocationRecord]:
+    try:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                parts = line.strip().split("|", 1)
+                if len(parts) != 2:
+                    continue
+                try:
+                    ts = int(parts[0])
+                except ValueError:
+                    continue
+                if ts >= since:
+                    yield InvocationRecord(ts, parts[1])
+    except IOError:
+        return
+
+
+def _parse_segment(path: Path, since: int) -> Iterator[InvocationRecord]:
+    try:
+        data = path.read_bytes()
+    except IOError:
+        return
+    yield from _decode_records(data, since)
+
+
+def iter_invocation_records(since: int = 0) -> Iterator[InvocationRecord]:
+    """Yield full records for invocations at or after `since`."""
+    if use_sqlite_store():
+        import sqlite_store
+        return sqlite_store.iter_invocation_records(since)
+    return iter_file_invocations(since)
+
+
+def iter_invocations(since: int = 0) -> Iterator[Tuple[int, str]]:
+    """Yield (timestamp, name) for invocations at or after `since`."""
+    return ((record.timestamp, record.name) for record in iter_invocation_records(since))
+
+
+def iter_file_invocations(since: int = 0) -> Iterator[InvocationRecord]:
+    """Yield invocations from the raw log files, oldest segment first."""
+    legacy = get_invocations_file()
+    if legacy.exists():
+        yield from _parse_lines(legacy, since)
+
+    for segment in list_segments(since):
+        yield from _parse_segment(segment, since)
+
+
+def _migrate_legacy_log() -> None:
+    """Split a pre-segment invocations.log into daily segments, then remove it."""
+    legacy = get_invocations_file()
+    if not legacy.exists():
+        return
+
+    with file_lock(get_lock_file()):
+        by_day: Dict[str, List[bytes]] = {}
+        for record in _parse_lines(legacy, 0):
+            by_day.setdefault(segment_day(record.timestamp), []).append(_encode_record(record))
+
+        segments_dir = get_invocations_dir()
+        for day, records in by_day.items():
+            _append_bytes(segments_dir / f"{day}{SEGMENT_SUFFIX}", b"".join(records))
+
+        legacy.unlink()
+
+
+def _compact_closed_days() -> None:
+    """Fold raw segments of days before today into the counters."""
+    today = segment_day(int(time.time()))
+
+    def pending(rollup: Dict[str, Any]) -> List[Path]:
+        return [
+            path for path in list_segments(0)
+            if rollup["compacted_through"] < path.stem < today
+        ]
+
+    if not pending(_load_rollup_unlocked()):
+        return  # Common case: already compacted, no lock, no write
+
+    with file_lock(get_lock_file()):
+        rollup = _load_rollup_unlocked()
+        segments = pending(rollup)
+        for segment in segments:
+            for record in _parse_segment(segment, 0):
+                _count(rollup, record.timestamp, record.name)
+        if segments:
+            rollup["compacted_through"] = segments[-1].stem
+            _save_rollup_unlocked(rollup)
+
+
+def _prune_rollup(retention_days: int) -> None:
+    cutoff_day = segment_day(int(time.time()) - retention_days * 86400)
+    if all(day >= cutoff_day for day in _load_rollup_unlocked()["days"]):
+        return  # Common case: nothing to drop, no write
+
+    with file_lock(get_lock_file()):
+        rollup = _load_rollup_unlocked()
+        rollup["days"] = {
+            day: counts for day, counts in rollup["days"].items() if day >= cutoff_day
+        }
+        _save_rollup_unlocked(rollup)
+
+
+def prune_invocations(retention_days: int = RETENTION_DAYS) -> None:
+    """Compact closed days, drop whole segments past retention and trim old counters."""
+    if use_sqlite_store():
+        import sqlite_store
+        # Rows are indexed, so keep as much history as the counters would
+        sqlite_store.prune_invocations(max(retention_days, ROLLUP_RETENTION_DAYS))
+        return
+
+    try:
+        _migrate_legacy_log()
+    except (OSError, IOError):
+        pass  # Keep reading the legacy file; retry next session
+
+    _compact_closed_days()
+    _prune_rollup(max(retention_days, ROLLUP_RETENTION_DAYS))
+
+    cutoff_day = segment_day(int(time.time()) - retention_days * 86400)
+    for path in list_segments(0):
+        if path.stem < cutoff_day:
+            try:
+                path.unlink()
+            except OSError:
+                pass  # Another session pruned it first
+
+
+def _stress_name(index: int) -> str:
+    # Long names make each write big enough that interleaving would show
+    return f"writer-{index:03d}-" + "x" * 200
+
+
+def _stress_writer(index: int, records: int) -> None:
+    name = _stress_name(index)
+    now = int(time.time())
+    for _ in range(records):
+        append_invocation(name, now, kind="skill", duration_ms=7, session_id="stress")
+
+
+def stress_test(writers: int = 50, records: int = 200) -> int:
+    """
+    Hammer the lock-free append path from concurrent processes.
+
+    Runs against a throwaway HOME and checks every line parses and every
+    record arrived exactly once. Returns 0 on success.
+    """
+    import multiprocessing
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as home:
+        os.environ["HOME"] = home
+        os.environ.pop("LASTMILEFIRST_STORE", None)
+        os.environ.pop(RAW_LOG_ENV, None)
+
+        processes = [
+            multiprocessing.Process(target=_stress_writer, args=(i, records))
+            for i in range(writers)
+        ]
+        start = time.monotonic()
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        elapsed = time.monotonic() - start
+
+        decoded = list(iter_file_invocations(0))
+        segment_bytes = sum(segment.stat().st_size for segment in list_segments(0))
+
+        expected = {_stress_name(i): records for i in range(writers)}
+        seen: Dict[str, int] = {}
+        malformed = 0
+        for record in decoded:
+            if record.name not in expected or record.kind != "skill" or record.duration_ms != 7:
+                malformed += 1
+                continue
+            seen[record.name] = seen.get(record.name, 0) + 1
+
+        total = writers * records
+        print(f"{writers} writers x {records} records in {elapsed:.2f}s ({total / elapsed:.0f} appends/s)")
+        print(f"Records: {len(decoded)}/{total} ({segment_bytes} bytes), malformed: {malformed}, mismatched writers: "
+              f"{sum(1 for name, n in expected.items() if seen.get(name) != n)}")
+
+        ok = malformed == 0 and seen == expected
+        print("OK: no interleaving" if ok else "FAIL: interleaved or lost records")
+        return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "stress":
+        sys.exit(stress_test(
+            writers=int(sys.argv[2]) if len(sys.argv) > 2 else 50,
+            records=int(sys.argv[3]) if len(sys.argv) > 3 else 200,
+        ))
+    print("Usage: invocations.py stress [WRITERS] [RECORDS]")
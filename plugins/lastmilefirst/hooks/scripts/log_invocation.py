@@ -1,29 +1,64 @@
 #!/usr/bin/env python3
 """
 Lastmilefirst Overwatch - Log Invocation
-Logs skill/command invocations for usage tracking.
-Usage: log_invocation.py <skill-name>
+Logs skill/agent invocations for usage tracking.
+Usage: log_invocation.py <skill|agent>
+
+Reads the PostToolUse payload from stdin to record which skill or agent
+ran, how long the tool call took and the session it belongs to.
 """
 
 import sys
-import time
 from pathlib import Path
+from typing import Any, Dict
 
 # Add script directory to path for local imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from overwatch import get_invocations_file, get_lock_file, file_lock
+from invocations import append_invocation
+from overwatch import read_hook_payload
+
+# tool_input keys naming the invoked skill/agent, most specific first
+NAME_KEYS = {
+    "skill": ("skill", "command", "name"),
+    "agent": ("subagent_type", "agent", "name"),
+}
+
+
+def invocation_name(kind: str, payload: Dict[str, Any]) -> str:
+    """Pick the skill/agent name out of the tool input, falling back to the kind."""
+    tool_input = payload.get("tool_input")
+    if isinstance(tool_input, dict):
+        for key in NAME_KEYS.get(kind, ("name",)):
+            value = tool_input.get(key)
+            if isinstance(value, str) and value.strip():
+                return value.strip()
+    return kind
+
+
+def tool_duration_ms(payload: Dict[str, Any]) -> int:
+    """Tool duration if Claude Code reported one, else 0."""
+    for container in (payload, payload.get("tool_response")):
+        if not isinstance(container, dict):
+            continue
+        for key in ("duration_ms", "durationMs", "totalDurationMs"):
+            value = container.get(key)
+            if isinstance(value, (int, float)) and value >= 0:
+                return int(value)
+    return 0
 
 
 def main() -> None:
-    skill_name = sys.argv[1] if len(sys.argv) > 1 else "unknown"
-    invocations_file = get_invocations_file()
-    timestamp = int(time.time())
-
-    # Use file locking to prevent interleaved writes from concurrent processes
-    with file_lock(get_lock_file()):
-        with open(invocations_file, 'a', encoding='utf-8') as f:
-            f.write(f"{timestamp}|{skill_name}\n")
+    kind = sys.argv[1] if len(sys.argv) > 1 else "unknown"
+    payload = read_hook_payload()
+    session_id = payload.get("session_id")
+
+    append_invocation(
+        invocation_name(kind, payload),
+        kind=kind,
+        duration_ms=tool_duration_ms(payload),
+        session_id=session_id if isinstance(session_id, str) else "",
+    )
 
 
 if __name__ == "__main__":
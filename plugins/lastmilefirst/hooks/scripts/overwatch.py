@@ -6,6 +6,7 @@ Provides file locking, state management, and shared functionality.
 
 import json
 import os
+import re
 import sys
 import time
 from pathlib import Path
@@ -25,6 +26,18 @@ try:
 except ImportError:
     HAS_MSVCRT = False
 
+# Optional SQLite backend (LASTMILEFIRST_STORE=sqlite)
+try:
+    import sqlite3  # noqa: F401
+    HAS_SQLITE = True
+except ImportError:
+    HAS_SQLITE = False
+
+STORE_ENV = "LASTMILEFIRST_STORE"
+
+# Change logs of sessions that never reached SessionEnd are dropped after this
+SESSION_CHANGES_MAX_AGE_DAYS = 7
+
 
 def get_state_dir() -> Path:
     """Get the Overwatch state directory, creating if needed."""
@@ -44,10 +57,37 @@ def get_lock_file() -> Path:
 
 
 def get_invocations_file() -> Path:
-    """Get the path to the invocations log."""
+    """Get the path to the legacy single-file invocations log."""
     return get_state_dir() / "invocations.log"
 
 
+def get_invocations_dir() -> Path:
+    """Get the directory holding daily invocation log segments, creating if needed."""
+    invocations_dir = get_state_dir() / "invocations"
+    invocations_dir.mkdir(parents=True, exist_ok=True)
+    return invocations_dir
+
+
+def get_usage_rollup_file() -> Path:
+    """Get the path to the per-day invocation counters."""
+    return get_state_dir() / "usage-rollup.json"
+
+
+def get_timings_file() -> Path:
+    """Get the path to the rolling SessionStart check timings file."""
+    return get_state_dir() / "check-timings.jsonl"
+
+
+def get_timings_lock_file() -> Path:
+    """Get the path to the lock file guarding timings trims."""
+    return get_state_dir() / "check-timings.lock"
+
+
+def use_sqlite_store() -> bool:
+    """Whether state and invocations live in SQLite instead of flat files."""
+    return HAS_SQLITE and os.environ.get(STORE_ENV, "").lower() == "sqlite"
+
+
 def get_tmp_dir() -> Path:
     """Get the tmp directory for session tracking."""
     tmp_dir = Path.home() / ".claude" / "tmp"
@@ -55,6 +95,27 @@ def get_tmp_dir() -> Path:
     return tmp_dir
 
 
+def get_session_changes_file(session_id: str = "") -> Path:
+    """Get the log of files edited during a session (shared log when there is no session id)."""
+    if not session_id:
+        return get_tmp_dir() / "session-changes.log"
+    safe_id = re.sub(r"[^A-Za-z0-9_.-]", "_", session_id)[:64]
+    return get_tmp_dir() / f"session-changes-{safe_id}.log"
+
+
+def clear_session_changes(session_id: str = "") -> None:
+    """Remove a session's change log, plus logs left behind by sessions that never ended."""
+    get_session_changes_file(session_id).unlink(missing_ok=True)
+
+    cutoff = time.time() - SESSION_CHANGES_MAX_AGE_DAYS * 86400
+    for path in get_tmp_dir().glob("session-changes-*.log"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            continue
+
+
 @contextmanager
 def file_lock(lock_path: Path):
     """
@@ -82,6 +143,36 @@ def file_lock(lock_path: Path):
             lock_file.close()
 
 
+@contextmanager
+def try_file_lock(lock_path: Path):
+    """
+    Non-blocking variant of file_lock(): yields True if the lock was taken,
+    False if another process holds it.
+    """
+    lock_file = open(lock_path, 'w', encoding='utf-8')
+    acquired = False
+    try:
+        try:
+            if HAS_FCNTL:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            elif HAS_MSVCRT:
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+            acquired = True
+        except OSError:
+            pass
+        yield acquired
+    finally:
+        if acquired:
+            if HAS_FCNTL:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            elif HAS_MSVCRT:
+                try:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+                except OSError:
+                    pass
+        lock_file.close()
+
+
 def _load_state_unlocked() -> Dict[str, Any]:
     """
     Load state without acquiring lock. Internal use only.
@@ -122,6 +213,10 @@ def load_state() -> Dict[str, Any]:
         "last_plugin_check": 0
     }
 
+    if use_sqlite_store():
+        import sqlite_store
+        return sqlite_store.load_state(default_state)
+
     with file_lock(lock_file):
         state = _load_state_unlocked()
         # Initialize file if it doesn't exist
@@ -137,6 +232,11 @@ def save_state(state: Dict[str, Any]) -> None:
     state_file = get_state_file()
     lock_file = get_lock_file()
 
+    if use_sqlite_store():
+        import sqlite_store
+        sqlite_store.save_state(state)
+        return
+
     with file_lock(lock_file):
         with open(state_file, 'w', encoding='utf-8') as f:
             json.dump(state, f)
@@ -147,6 +247,11 @@ def update_state_field(field: str, value: Any) -> None:
     lock_file = get_lock_file()
     state_file = get_state_file()
 
+    if use_sqlite_store():
+        import sqlite_store
+        sqlite_store.update_state_field(field, value)
+        return
+
     with file_lock(lock_file):
         state = _load_state_unlocked()
         state[field] = value
@@ -154,6 +259,85 @@ def update_state_field(field: str, value: Any) -> None:
             json.dump(state, f)
 
 
+# Number of sessions kept in the timings file
+MAX_TIMING_SESSIONS = 100
+
+
+def record_check_timings(timings: Dict[str, float], timed_out: List[str]) -> None:
+    """
+    Append one session's per-check timings (seconds) to the rolling metrics file.
+
+    Never blocks: a timed-out check may still be holding overwatch.lock, so
+    the record goes out as a single O_APPEND write with no lock. Once the
+    file holds twice MAX_TIMING_SESSIONS records it is trimmed under its own
+    lock, and only if that lock is free; otherwise the next session trims.
+    """
+    timings_file = get_timings_file()
+    record = json.dumps({
+        "ts": int(time.time()),
+        "timings": {name: round(elapsed, 4) for name, elapsed in timings.items()},
+        "timed_out": timed_out,
+    })
+
+    flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+    fd = os.open(str(timings_file), flags, 0o600)
+    try:
+        os.write(fd, (record + '\n').encode('utf-8'))
+    finally:
+        os.close(fd)
+
+    with open(timings_file, encoding='utf-8') as f:
+        if sum(1 for _ in f) < 2 * MAX_TIMING_SESSIONS:
+            return
+
+    with try_file_lock(get_timings_lock_file()) as acquired:
+        if not acquired:
+            return
+        with open(timings_file, encoding='utf-8') as f:
+            lines = [line for line in f.read().split('\n') if line]
+        if len(lines) < 2 * MAX_TIMING_SESSIONS:
+            return  # Another session trimmed first
+        tmp_file = timings_file.with_name(f"{timings_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines[-MAX_TIMING_SESSIONS:]) + '\n')
+        os.replace(tmp_file, timings_file)
+
+
+def load_check_timings(sessions: int = MAX_TIMING_SESSIONS) -> List[Dict[str, Any]]:
+    """Load the timing records of the most recent sessions, oldest first."""
+    timings_file = get_timings_file()
+    if not timings_file.exists():
+        return []
+
+    records: List[Dict[str, Any]] = []
+    try:
+        with open(timings_file, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue  # Skip partial lines
+    except IOError:
+        return []
+
+    return records[-sessions:] if sessions > 0 else records
+
+
+def read_hook_payload() -> Dict[str, Any]:
+    """
+    Parse the JSON payload Claude Code pipes to hook commands on stdin.
+    Returns an empty dict when run by hand or when the payload is unusable.
+    """
+    if sys.stdin is None or sys.stdin.isatty():
+        return {}
+    try:
+        data = sys.stdin.read()
+        payload = json.loads(data) if data.strip() else {}
+    except (OSError, ValueError):
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
 def get_plugins_dir() -> Optional[Path]:
     """Get the Claude plugins directory."""
     if os.environ.get("CLAUDE_PLUGINS_DIR"):
@@ -199,4 +383,5 @@ if __name__ == "__main__":
     print(f"State dir: {get_state_dir()}")
     print(f"Has fcntl: {HAS_FCNTL}")
     print(f"Has msvcrt: {HAS_MSVCRT}")
+    print(f"SQLite store: {use_sqlite_store()}")
     print(f"State: {load_state()}")
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Lastmilefirst Overwatch - Record Change
+Records which files Edit/Write tool calls touched during the session.
+Usage: record_change.py [--clear]
+
+Reads the PostToolUse payload from stdin and appends the edited path to the
+session's change log (one per session_id). Appends never read the log;
+repeated edits of the same file are coalesced by the reader (stop_hook.py).
+--clear removes the log (SessionEnd).
+"""
+
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Add script directory to path for local imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from overwatch import clear_session_changes, get_session_changes_file, read_hook_payload
+
+# tool_input keys holding the edited path, per tool
+PATH_KEYS = ("file_path", "notebook_path", "path")
+
+
+def changed_path(payload: Dict[str, Any]) -> Optional[str]:
+    """Absolute path of the file the tool call edited, if the payload names one."""
+    tool_input = payload.get("tool_input")
+    if not isinstance(tool_input, dict):
+        return None
+
+    for key in PATH_KEYS:
+        value = tool_input.get(key)
+        if isinstance(value, str) and value.strip():
+            path = Path(value.strip())
+            if not path.is_absolute():
+                path = Path(payload.get("cwd") or os.getcwd()) / path
+            return os.path.normpath(str(path))
+    return None
+
+
+def record(entry: str, session_id: str = "") -> None:
+    """Append an entry to the session's log; O(1) however long the log is."""
+    session_log = get_session_changes_file(session_id)
+
+    # Single O_APPEND write keeps concurrent hooks from interleaving
+    fd = os.open(str(session_log), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+    try:
+        os.write(fd, (entry + "\n").encode("utf-8"))
+    finally:
+        os.close(fd)
+
+
+def main() -> None:
+    payload = read_hook_payload()
+    session_id = str(payload.get("session_id") or "")
+
+    if len(sys.argv) > 1 and sys.argv[1] == "--clear":
+        clear_session_changes(session_id)
+        return
+
+    if not payload:
+        # Nothing to record, e.g. the hooks.json `|| python3` fallback re-running
+        # after the first interpreter already consumed stdin
+        return
+
+    path = changed_path(payload)
+    if path is None:
+        # No path in the payload: still note that the session edited something
+        path = str(payload.get("tool_name") or "edit").lower()
+
+    record(path, session_id)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,16 +5,28 @@ Cross-platform Python script launcher for lastmilefirst hooks.
 Finds the correct Python interpreter and runs the target script.
 Works on Windows (python/py), macOS (python3), and Linux (python3).
 
+Scripts run inside this interpreter by default. Set
+LASTMILEFIRST_HOOK_SUBPROCESS=1 to run each one in a child interpreter.
+
 Usage: Invoke with any available Python:
   python run.py <script.py> [args...]
   python3 run.py <script.py> [args...]
   py run.py <script.py> [args...]
 """
 
+import io
 import os
+import runpy
 import subprocess
 import sys
+import threading
+import traceback
 from pathlib import Path
+from typing import List, Optional
+
+SCRIPT_TIMEOUT_SECONDS = 30
+DAEMON_ENV = "LASTMILEFIRST_HOOK_DAEMON"
+SUBPROCESS_ENV = "LASTMILEFIRST_HOOK_SUBPROCESS"
 
 
 def find_python() -> str:
@@ -43,6 +55,70 @@ def find_python() -> str:
     return sys.executable
 
 
+def _exit_code(code: object) -> int:
+    """Translate a SystemExit code the way the interpreter would."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def exec_script(script_path: Path, args: List[str]) -> int:
+    """
+    Run a hook script as __main__ inside the current interpreter.
+
+    Restores sys.argv and sys.path afterwards so repeated runs (e.g. from
+    the hook daemon) don't accumulate state. Returns the script's exit code.
+    """
+    saved_argv = sys.argv
+    saved_path = sys.path[:]
+    sys.argv = [str(script_path)] + list(args)
+    try:
+        runpy.run_path(str(script_path), run_name="__main__")
+        return 0
+    except SystemExit as e:
+        return _exit_code(e.code)
+    except Exception:
+        traceback.print_exc()
+        return 1
+    finally:
+        sys.argv = saved_argv
+        sys.path[:] = saved_path
+
+
+def run_with_timeout(script_path: Path, args: List[str], timeout: float) -> Optional[int]:
+    """
+    Run exec_script on a watchdog-supervised daemon thread.
+
+    Returns the exit code, or None if the script is still running after
+    `timeout` seconds. A hung thread cannot be killed, so callers must end
+    the process when this returns None.
+    """
+    result: List[int] = []
+
+    def target() -> None:
+        result.append(exec_script(script_path, args))
+
+    worker = threading.Thread(target=target, name="hook-script", daemon=True)
+    worker.start()
+    worker.join(timeout)
+    if worker.is_alive():
+        return None
+    return result[0] if result else 1
+
+
+def read_stdin() -> str:
+    """Read the hook payload from stdin, if one was piped in."""
+    if sys.stdin is None or sys.stdin.isatty():
+        return ""
+    try:
+        return sys.stdin.read()
+    except (OSError, ValueError):
+        return ""
+
+
 def main() -> int:
     if len(sys.argv) < 2:
         print("Usage: run.py <script.py> [args...]", file=sys.stderr)
@@ -63,11 +139,37 @@ def main() -> int:
         print(f"Script not found: {script}", file=sys.stderr)
         return 1
 
+    # Opt-in hook daemon: run inside a warm interpreter when one is available
+    stdin_data = None
+    if os.environ.get(DAEMON_ENV) == "1":
+        import hookd
+
+        if hookd.daemon_enabled():
+            stdin_data = read_stdin()
+            returncode = hookd.call(script_path, args, stdin_data)
+            if returncode is not None:
+                return returncode
+            hookd.spawn()  # Start it for the next event; handle this one ourselves
+
+    if os.environ.get(SUBPROCESS_ENV) != "1":
+        # Run in this interpreter - no second Python startup per hook
+        if stdin_data is not None:
+            sys.stdin = io.StringIO(stdin_data)
+        returncode = run_with_timeout(script_path, args, SCRIPT_TIMEOUT_SECONDS)
+        if returncode is None:
+            print(f"Script timed out: {script}", file=sys.stderr)
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(1)
+        return returncode
+
     # Run with current Python (we're already in Python 3 if we got here)
     try:
         result = subprocess.run(
             [sys.executable, str(script_path)] + args,
-            timeout=30,
+            input=stdin_data,
+            text=stdin_data is not None,
+            timeout=SCRIPT_TIMEOUT_SECONDS,
         )
         return result.returncode
     except subprocess.TimeoutExpired:
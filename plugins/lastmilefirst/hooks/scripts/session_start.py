@@ -8,12 +8,12 @@ Output becomes part of Claude's context.
 import json
 import os
 import random
-import subprocess
 import sys
+import threading
 import time
 from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 # Add script directory to path for local imports
 sys.path.insert(0, str(Path(__file__).parent))
@@ -21,43 +21,49 @@ sys.path.insert(0, str(Path(__file__).parent))
 from overwatch import (
     load_state,
     get_plugins_dir,
-    get_invocations_file,
-    get_tmp_dir,
-    get_lock_file,
-    file_lock,
+    clear_session_changes,
+    read_hook_payload,
+    record_check_timings,
     version_compare,
 )
+from gitstatus import get_status
+from invocations import load_usage_counts, prune_invocations
+from workspace_git import discover_repos, sweep
 
 # Path to todos-summary scripts (sibling skill)
 TODOS_SUMMARY_SCRIPTS = Path(__file__).parent.parent.parent / "skills" / "todos-summary" / "scripts"
 
+# Per-check budget; leaves headroom under the 10s SessionStart hook timeout
+CHECK_DEADLINE_SECONDS = 7.0
+WORKSPACE_SWEEP_SECONDS = 5.0  # Leaves the sweep time to report inside the check deadline
+
 
 def check_git_status() -> Optional[str]:
     """Check for uncommitted git changes in current directory."""
-    try:
-        result = subprocess.run(
-            ["git", "rev-parse", "--git-dir"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode != 0:
-            return None
-
-        result = subprocess.run(
-            ["git", "status", "--porcelain"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        lines = [line for line in result.stdout.strip().split('\n') if line]
-        if lines:
-            return f"  {len(lines)} uncommitted file(s) in this repo"
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        pass  # Git not available or too slow - skip silently
+    status = get_status()
+    if status is None:
+        return None  # Not a repo, or git not available or too slow - skip silently
+    if status.count:
+        return f"  {status.describe()} uncommitted file(s) in this repo"
     return None
 
 
+def check_workspace_repos() -> Optional[str]:
+    """Check other repos in the workspace orgs for uncommitted changes."""
+    cwd = os.path.realpath(os.getcwd())
+    repos = [
+        (name, path) for name, path in discover_repos()
+        if not (cwd + os.sep).startswith(os.path.realpath(path) + os.sep)
+    ]
+    dirty, _ = sweep(repos, deadline=WORKSPACE_SWEEP_SECONDS)
+    if not dirty:
+        return None
+
+    names = ", ".join(repo.describe() for repo in dirty[:3])
+    more = f", +{len(dirty) - 3} more" if len(dirty) > 3 else ""
+    return f"  {len(dirty)} other workspace repo(s) with uncommitted changes: {names}{more}"
+
+
 def check_review_status(state: Dict) -> Optional[str]:
     """Check days since last review."""
     last_review = state.get("last_review", 0)
@@ -140,56 +146,31 @@ def check_plugin_updates() -> List[str]:
 
 def check_usage_stats() -> List[str]:
     """Generate usage statistics for the past week."""
-    invocations_file = get_invocations_file()
-    if not invocations_file.exists():
-        return []
-
     week_ago = int(time.time()) - 604800
-    month_ago = int(time.time()) - 2592000
-
-    weekly_invocations: List[str] = []
-    retained_lines: List[str] = []
 
     try:
-        with open(invocations_file, encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                parts = line.split("|")
-                if len(parts) >= 2:
-                    try:
-                        ts = int(parts[0])
-                        if ts >= month_ago:
-                            retained_lines.append(line)
-                        if ts >= week_ago:
-                            weekly_invocations.append(parts[1])
-                    except ValueError:
-                        continue
-
-        # Prune old entries with file locking to prevent race with log_invocation
-        with file_lock(get_lock_file()):
-            with open(invocations_file, 'w', encoding='utf-8') as f:
-                if retained_lines:
-                    f.write('\n'.join(retained_lines) + '\n')
-
-    except IOError:
+        # Drops whole day segments past retention; never rewrites the log
+        prune_invocations()
+        # Per-day counters: O(days) regardless of how many events were logged
+        weekly_counts, _ = load_usage_counts(since=week_ago)
+    except (OSError, IOError):
         return []
 
-    if not weekly_invocations:
+    total = sum(weekly_counts.values())
+    if not total:
         return []
 
-    results = [f"{len(weekly_invocations)} skill invocations this week"]
+    results = [f"{total} skill invocations this week"]
 
     # Count top skills
-    counts = Counter(s for s in weekly_invocations if s != "unknown")
+    counts = Counter({name: n for name, n in weekly_counts.items() if name != "unknown"})
     if counts:
         top = counts.most_common(3)
         top_str = " ".join(f"{name} ({count})" for name, count in top)
         results.append(f"   Top: {top_str}")
 
     # Occasional prompt (roughly 1 in 10)
-    if random.randint(0, 9) == 0 and len(weekly_invocations) >= 10:
+    if random.randint(0, 9) == 0 and total >= 10:
         results.append("   Enjoying these plugins? Consider starring their repos!")
 
     return results
@@ -228,7 +209,7 @@ def check_cross_project_blockers() -> List[str]:
     Check for urgent/blocked todos across all projects.
 
     Uses the todos-summary aggregator to scan workspaces and report
-    items that need attention.
+    items that need attention, stopping once there are enough to report.
     """
     results: List[str] = []
 
@@ -243,11 +224,17 @@ def check_cross_project_blockers() -> List[str]:
         from formatters import OverwatchFormatter
 
         aggregator = TodoAggregator()
-        data = aggregator.aggregate_todos(use_cache=True)
+        todos = aggregator.iter_todos(
+            aggregator.select_orgs(),
+            filter=lambda todo: todo.state in ("urgent", "blocked"),
+        )
 
-        # Use the Overwatch formatter for compact output
-        formatter = OverwatchFormatter()
-        output = formatter.format(data)
+        # Use the Overwatch formatter for compact output; it stops reading
+        # after enough items, and close() then saves the index
+        try:
+            output = OverwatchFormatter().format_items(todos)
+        finally:
+            todos.close()
 
         if output:
             for line in output.split("\n"):
@@ -265,53 +252,101 @@ def check_cross_project_blockers() -> List[str]:
     return results
 
 
-def main() -> None:
+def _plugin_update_alerts() -> List[str]:
+    """Wrap plugin updates with their header and hint lines."""
+    plugin_updates = check_plugin_updates()
+    if not plugin_updates:
+        return []
+    return (
+        ["Plugin updates available:"]
+        + plugin_updates
+        + ["   Run: claude plugin update <plugin>@<marketplace>"]
+    )
+
+
+def _one(alert: Optional[str]) -> List[str]:
+    return [alert] if alert else []
+
+
+# Check registry: (name, check). Checks run concurrently, but their alerts
+# are always emitted in this order.
+CHECKS: List[Tuple[str, Callable[[Dict], List[str]]]] = [
+    ("git_status", lambda state: _one(check_git_status())),
+    ("workspace_repos", lambda state: _one(check_workspace_repos())),
+    ("review_status", lambda state: _one(check_review_status(state))),
+    ("organize_status", lambda state: _one(check_organize_status(state))),
+    ("plugin_updates", lambda state: _plugin_update_alerts()),
+    ("usage_stats", lambda state: check_usage_stats()),
+    ("stale_todos", lambda state: _one(check_stale_todos())),
+    ("claude_md", lambda state: _one(check_claude_md())),
+    ("cross_project_blockers", lambda state: check_cross_project_blockers()),
+]
+
+
+def run_checks(
+    checks: List[Tuple[str, Callable[[Dict], List[str]]]],
+    state: Dict,
+    deadline: float = CHECK_DEADLINE_SECONDS,
+) -> Tuple[List[str], Dict[str, float], List[str]]:
+    """
+    Run checks concurrently and collect their alerts in registry order.
+
+    Each check gets its own daemon thread so one that misses the deadline
+    is dropped from the output without holding up interpreter exit.
+    A check that raises contributes no alerts.
+
+    Returns (alerts, elapsed seconds per check, names of checks that timed out).
+    Timed-out checks are reported with the deadline as their elapsed time.
+    """
+    results: Dict[str, List[str]] = {}
+    elapsed: Dict[str, float] = {}
+
+    def worker(name: str, check: Callable[[Dict], List[str]]) -> None:
+        start = time.monotonic()
+        try:
+            results[name] = check(state)
+        except Exception:
+            results[name] = []  # Never break session start over one check
+        finally:
+            elapsed[name] = time.monotonic() - start
+
+    threads = []
+    for name, check in checks:
+        thread = threading.Thread(
+            target=worker, args=(name, check), name=f"overwatch-{name}", daemon=True
+        )
+        thread.start()
+        threads.append(thread)
+
+    started = time.monotonic()
+    for thread in threads:
+        thread.join(max(0.0, started + deadline - time.monotonic()))
+
     alerts: List[str] = []
+    timings: Dict[str, float] = {}
+    timed_out: List[str] = []
+    for name, _ in checks:
+        alerts.extend(results.get(name, []))
+        if name in elapsed:
+            timings[name] = elapsed[name]
+        else:
+            timings[name] = deadline
+            timed_out.append(name)
+    return alerts, timings, timed_out
 
-    # Load state
-    state = load_state()
 
-    # Check 1: Git status
-    git_alert = check_git_status()
-    if git_alert:
-        alerts.append(git_alert)
+def main() -> None:
+    payload = read_hook_payload()
 
-    # Check 2: Review status
-    review_alert = check_review_status(state)
-    if review_alert:
-        alerts.append(review_alert)
+    # Load state
+    state = load_state()
 
-    # Check 3: Organize status
-    organize_alert = check_organize_status(state)
-    if organize_alert:
-        alerts.append(organize_alert)
+    alerts, timings, timed_out = run_checks(CHECKS, state)
 
-    # Check 4: Plugin updates
-    plugin_updates = check_plugin_updates()
-    if plugin_updates:
-        alerts.append("Plugin updates available:")
-        alerts.extend(plugin_updates)
-        alerts.append("   Run: claude plugin update <plugin>@<marketplace>")
-
-    # Check 5: Usage stats
-    usage_stats = check_usage_stats()
-    if usage_stats:
-        alerts.extend(usage_stats)
-
-    # Check 6: Stale todos
-    todos_alert = check_stale_todos()
-    if todos_alert:
-        alerts.append(todos_alert)
-
-    # Check 7: CLAUDE.md
-    claude_md_alert = check_claude_md()
-    if claude_md_alert:
-        alerts.append(claude_md_alert)
-
-    # Check 8: Cross-project blockers
-    blocker_alerts = check_cross_project_blockers()
-    if blocker_alerts:
-        alerts.extend(blocker_alerts)
+    try:
+        record_check_timings(timings, timed_out)
+    except (OSError, IOError):
+        pass  # Metrics are best-effort
 
     # Output to both stdout (for Claude context) and stderr (for user terminal)
     if alerts:
@@ -333,9 +368,8 @@ def main() -> None:
             print(alert, file=sys.stderr)
 
     # Clear session change log
-    session_log = get_tmp_dir() / "session-changes.log"
     try:
-        session_log.unlink(missing_ok=True)
+        clear_session_changes(payload.get("session_id") or "")
     except (OSError, IOError):
         pass  # Ignore errors clearing log
 
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Lastmilefirst Overwatch - SQLite Store
+Optional backend for Overwatch state and the invocation log.
+
+Enable with LASTMILEFIRST_STORE=sqlite. Everything lives in one WAL-mode
+database (overwatch.db), so concurrent hook writers don't serialize on the
+flock file and invocation range queries use indexes on (ts) and (name, ts).
+Callers go through overwatch.py / invocations.py, never this module directly.
+"""
+
+import json
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Tuple
+
+# Add script directory to path for local imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from overwatch import get_state_dir, get_state_file
+
+if TYPE_CHECKING:
+    from invocations import InvocationRecord
+
+BUSY_TIMEOUT_MS = 5000
+
+# Statements run one by one inside _init_db()'s transaction
+SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS meta (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS state (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS invocations (
+        ts INTEGER NOT NULL,
+        name TEXT NOT NULL,
+        kind TEXT NOT NULL DEFAULT '',
+        duration_ms INTEGER NOT NULL DEFAULT 0,
+        session_id TEXT NOT NULL DEFAULT ''
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_invocations_ts ON invocations (ts)",
+    "CREATE INDEX IF NOT EXISTS idx_invocations_name_ts ON invocations (name, ts)",
+)
+
+# One connection per thread: session-start checks and the hook daemon
+# both call in from worker threads
+_local = threading.local()
+
+
+def get_db_file() -> Path:
+    """Get the path to the SQLite database."""
+    return get_state_dir() / "overwatch.db"
+
+
+def _connect() -> sqlite3.Connection:
+    db_file = get_db_file()
+    conn = getattr(_local, "conn", None)
+    if conn is not None and getattr(_local, "path", None) == db_file:
+        return conn
+
+    conn = sqlite3.connect(str(db_file), timeout=BUSY_TIMEOUT_MS / 1000, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+    _init_db(conn)
+
+    _local.conn = conn
+    _local.path = db_file
+    return conn
+
+
+def _init_db(conn: sqlite3.Connection) -> None:
+    """
+    Create the schema and seed it from the file store, in one transaction.
+
+    BEGIN IMMEDIATE makes hooks opening a new database at the same time
+    serialize here. The `imported` marker row is written together with the
+    schema, so whichever hook wins imports exactly once.
+    """
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        for statement in SCHEMA:
+            conn.execute(statement)
+
+        if conn.execute("SELECT 1 FROM meta WHERE key = 'imported'").fetchone():
+            return
+        _import_file_store(conn)
+        conn.execute("INSERT INTO meta (key, value) VALUES ('imported', '1')")
+
+
+def _import_file_store(conn: sqlite3.Connection) -> None:
+    """Seed an empty database from the JSON state file and raw invocation log."""
+    # Local import: invocations.py dispatches back to this module
+    from invocations import iter_file_invocations
+
+    state: Dict[str, Any] = {}
+    state_file = get_state_file()
+    if state_file.exists():
+        try:
+            with open(state_file, encoding='utf-8') as f:
+                state = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            state = {}
+
+    conn.executemany(
+        "INSERT OR IGNORE INTO state (key, value) VALUES (?, ?)",
+        [(key, json.dumps(value)) for key, value in state.items()],
+    )
+    conn.executemany(
+        "INSERT INTO invocations (ts, name, kind, duration_ms, session_id) "
+        "VALUES (?, ?, ?, ?, ?)",
+        iter_file_invocations(0),
+    )
+
+
+def load_state(defaults: Dict[str, Any]) -> Dict[str, Any]:
+    """Load all state keys, filling in defaults for missing ones."""
+    state = dict(defaults)
+    for key, value in _connect().execute("SELECT key, value FROM state"):
+        try:
+            state[key] = json.loads(value)
+        except json.JSONDecodeError:
+            continue
+    return state
+
+
+def save_state(state: Dict[str, Any]) -> None:
+    """Replace the whole state in one transaction."""
+    conn = _connect()
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute("DELETE FROM state")
+        conn.executemany(
+            "INSERT INTO state (key, value) VALUES (?, ?)",
+            [(key, json.dumps(value)) for key, value in state.items()],
+        )
+
+
+def update_state_field(field: str, value: Any) -> None:
+    """Upsert a single state key."""
+    conn = _connect()
+    with conn:
+        conn.execute(
+            "INSERT INTO state (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (field, json.dumps(value)),
+        )
+
+
+def append_invocation(record: "InvocationRecord") -> None:
+    conn = _connect()
+    with conn:
+        conn.execute(
+            "INSERT INTO invocations (ts, name, kind, duration_ms, session_id) "
+            "VALUES (?, ?, ?, ?, ?)",
+            tuple(record),
+        )
+
+
+def iter_invocation_records(since: int = 0) -> Iterator["InvocationRecord"]:
+    from invocations import InvocationRecord
+
+    rows = _connect().execute(
+        "SELECT ts, name, kind, duration_ms, session_id FROM invocations "
+        "WHERE ts >= ? ORDER BY ts",
+        (since,),
+    )
+    for row in rows:
+        yield InvocationRecord(*row)
+
+
+def usage_counts(since: int = 0) -> Tuple[Dict[str, int], int]:
+    """Count invocations per name at or after `since` (indexed range scan)."""
+    conn = _connect()
+    counts = dict(conn.execute(
+        "SELECT name, COUNT(*) FROM invocations WHERE ts >= ? GROUP BY name", (since,)
+    ))
+    last = conn.execute("SELECT MAX(ts) FROM invocations").fetchone()[0]
+    return counts, last or 0
+
+
+def prune_invocations(retention_days: int) -> None:
+    cutoff = int(time.time()) - retention_days * 86400
+    conn = _connect()
+    with conn:
+        conn.execute("DELETE FROM invocations WHERE ts < ?", (cutoff,))
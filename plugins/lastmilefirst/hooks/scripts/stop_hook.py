@@ -1,53 +1,74 @@
 #!/usr/bin/env python3
 """
 Lastmilefirst Overwatch - Stop Hook
-Checks for uncommitted changes at session end.
+Checks whether files edited this session are still uncommitted.
 """
 
-import subprocess
+import os
+import sys
 from pathlib import Path
+from typing import Dict, List
+
+# Add script directory to path for local imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from gitstatus import get_path_status, get_status
+from overwatch import get_session_changes_file, read_hook_payload
+
+MAX_LISTED_FILES = 10
+
+
+def report(changes: Dict[str, List[str]], cwd: str) -> None:
+    """Print the uncommitted session-edited files, relative to cwd where possible."""
+    files = []
+    for root, lines in changes.items():
+        for line in lines:
+            path = os.path.join(root, line[3:])
+            try:
+                rel = os.path.relpath(path, cwd)
+            except ValueError:
+                rel = path  # Different drive on Windows
+            files.append(f"{line[:2].strip() or '?'} {path if rel.startswith('..') else rel}")
+
+    if not files:
+        return
+
+    print(f"Note: {len(files)} file(s) edited this session are uncommitted:")
+    for entry in files[:MAX_LISTED_FILES]:
+        print(f"  {entry}")
+    if len(files) > MAX_LISTED_FILES:
+        print(f"  ... and {len(files) - MAX_LISTED_FILES} more")
 
 
 def main() -> None:
+    payload = read_hook_payload()
+
     # Check if session had file changes
-    session_log = Path.home() / ".claude" / "tmp" / "session-changes.log"
+    session_log = get_session_changes_file(payload.get("session_id") or "")
 
     if not session_log.exists():
         return
 
     try:
-        content = session_log.read_text().strip()
-        if not content:
+        entries = list(dict.fromkeys(line for line in session_log.read_text().splitlines() if line))
+        if not entries:
             return
-    except IOError:
+        last_change = session_log.stat().st_mtime
+    except (IOError, OSError):
         return
 
-    # Check if we're in a git repo with uncommitted changes
-    try:
-        # Check if in a git repo
-        result = subprocess.run(
-            ["git", "rev-parse", "--git-dir"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode != 0:
-            return
-
-        # Check for uncommitted changes
-        result = subprocess.run(
-            ["git", "status", "--porcelain"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-
-        lines = [line for line in result.stdout.strip().split('\n') if line]
-        if lines:
-            print(f"Note: {len(lines)} uncommitted file(s) in this repo.")
+    # Check only the files this session edited
+    paths = [entry for entry in entries if os.path.isabs(entry)]
+    if paths:
+        changes = get_path_status(paths)
+        report(changes, payload.get("cwd") or os.getcwd())
+        return
 
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        pass
+    # Older logs only note that something was edited: fall back to the whole repo.
+    # Reuse a cached status only if it was taken after the last recorded edit
+    status = get_status(not_before=last_change)
+    if status is not None and status.count:
+        print(f"Note: {status.describe()} uncommitted file(s) in this repo.")
 
 
 if __name__ == "__main__":
@@ -2,25 +2,70 @@
 """
 Lastmilefirst Overwatch - Update State
 Updates the Overwatch state file with timestamps.
-Usage: update_state.py <action>
-Actions: review, organize, plugin_check, status
+Usage: update_state.py <action> [args]
+Actions: review, organize, plugin_check, status, timings [SESSIONS]
 """
 
 import json
+import math
 import sys
 import time
 from datetime import datetime
 from pathlib import Path
+from typing import Dict, List
 
 # Add script directory to path for local imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from overwatch import load_state, update_state_field, get_state_file
+from overwatch import (
+    MAX_TIMING_SESSIONS,
+    load_check_timings,
+    load_state,
+    update_state_field,
+    get_state_file,
+)
+
+USAGE = "Usage: update_state.py <review|organize|plugin_check|status|timings [SESSIONS]>"
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def print_timings(sessions: int) -> None:
+    """Print p50/p95 per SessionStart check over the last N sessions."""
+    records = load_check_timings(sessions)
+    if not records:
+        print("No check timings recorded yet - they are written at session start.")
+        return
+
+    by_check: Dict[str, List[float]] = {}
+    timeouts: Dict[str, int] = {}
+    for record in records:
+        for name, elapsed in record.get("timings", {}).items():
+            by_check.setdefault(name, []).append(float(elapsed))
+        for name in record.get("timed_out", []):
+            timeouts[name] = timeouts.get(name, 0) + 1
+
+    print(f"SessionStart check timings (last {len(records)} sessions, ms)")
+    print(f"{'check':<26}{'p50':>9}{'p95':>9}{'max':>9}  timeouts")
+    ranked = sorted(by_check.items(), key=lambda item: -percentile(item[1], 95))
+    for name, values in ranked:
+        print(
+            f"{name:<26}"
+            f"{percentile(values, 50) * 1000:>9.1f}"
+            f"{percentile(values, 95) * 1000:>9.1f}"
+            f"{max(values) * 1000:>9.1f}"
+            f"  {timeouts.get(name, 0)}"
+        )
 
 
 def main() -> None:
     if len(sys.argv) < 2:
-        print("Usage: update_state.py <review|organize|plugin_check|status>")
+        print(USAGE)
         sys.exit(1)
 
     action = sys.argv[1]
@@ -43,9 +88,17 @@ def main() -> None:
         state = load_state()
         print(json.dumps(state, indent=2))
 
+    elif action == "timings":
+        try:
+            sessions = int(sys.argv[2]) if len(sys.argv) > 2 else MAX_TIMING_SESSIONS
+        except ValueError:
+            print(USAGE)
+            sys.exit(1)
+        print_timings(sessions)
+
     else:
         print(f"Unknown action: {action}")
-        print("Usage: update_state.py <review|organize|plugin_check|status>")
+        print(USAGE)
         sys.exit(1)
 
 
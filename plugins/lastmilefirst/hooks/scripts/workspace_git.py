@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Lastmilefirst Overwatch - Workspace Git Sweep
+Finds repositories with uncommitted changes across every project in the
+workspace orgs (as configured for todos-summary).
+
+Each repo's result is cached in workspace-git-cache.json keyed by its
+.git/index mtime and size, so an unchanged repo costs one stat. Staging,
+committing and checkouts rewrite the index; editing a tracked file or
+adding an untracked one does not, so those changes only show up once the
+entry is older than CACHE_MAX_AGE_SECONDS. Repos that need a fresh
+`git status` are handed to a fixed pool of daemon worker threads;
+whatever has not finished by the deadline is skipped this time and picked up
+on the next sweep.
+
+Usage: workspace_git.py [DEADLINE_SECONDS]
+"""
+
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+# Add script directory to path for local imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from gitstatus import run_status
+from overwatch import get_state_dir
+
+# Path to todos-summary scripts (sibling skill) for the workspace config
+TODOS_SUMMARY_SCRIPTS = Path(__file__).parent.parent.parent / "skills" / "todos-summary" / "scripts"
+
+MAX_WORKERS = 8
+SWEEP_DEADLINE_SECONDS = 5.0
+# Bounds how long unstaged edits can go unreported (they leave the index alone)
+CACHE_MAX_AGE_SECONDS = 300
+
+
+class DirtyRepo(NamedTuple):
+    """A workspace repository with uncommitted changes."""
+    name: str         # org/project
+    path: str
+    changed: int      # Tracked files with changes
+    untracked: int    # Untracked entries (directories collapsed)
+    complete: bool    # False if the untracked probe was cut short
+
+    def describe(self) -> str:
+        count = self.changed + self.untracked
+        return f"{self.name} ({count}{'' if self.complete else '+'})"
+
+
+def get_cache_file() -> Path:
+    """Get the path to the workspace sweep cache."""
+    return get_state_dir() / "workspace-git-cache.json"
+
+
+def discover_repos() -> List[Tuple[str, Path]]:
+    """List (org/project, path) for every git repo directly under a workspace org."""
+    if not TODOS_SUMMARY_SCRIPTS.exists():
+        return []
+
+    sys.path.insert(0, str(TODOS_SUMMARY_SCRIPTS))
+    try:
+        from aggregator import TodoAggregator
+        aggregator = TodoAggregator()
+    except ImportError:
+        return []
+    finally:
+        if str(TODOS_SUMMARY_SCRIPTS) in sys.path:
+            sys.path.remove(str(TODOS_SUMMARY_SCRIPTS))
+
+    repos = []
+    for org in aggregator.get_orgs():
+        try:
+            entries = sorted(os.scandir(org.path), key=lambda e: e.name)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.name.startswith(".") or entry.name in aggregator.exclude_patterns:
+                continue
+            if entry.is_dir() and os.path.exists(os.path.join(entry.path, ".git")):
+                repos.append((f"{org.name}/{entry.name}", Path(entry.path)))
+    return repos
+
+
+def _index_key(repo: Path) -> List[int]:
+    git_dir = repo / ".git"
+    try:
+        if git_dir.is_file():
+            # Worktree or submodule: .git holds "gitdir: <path>"
+            target = git_dir.read_text(encoding="utf-8").strip().partition("gitdir:")[2].strip()
+            git_dir = repo / target
+        st = (git_dir / "index").stat()
+    except OSError:
+        return [0, 0]  # No index yet
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _load_cache() -> Dict[str, Any]:
+    try:
+        with open(get_cache_file(), encoding="utf-8") as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _save_cache(cache: Dict[str, Any]) -> None:
+    cache_file = get_cache_file()
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        tmp_file.unlink(missing_ok=True)
+
+
+def _status_entry(repo: Path, key: List[int]) -> Optional[Dict[str, Any]]:
+    try:
+        status = run_status(str(repo))
+    except Exception:
+        return None  # Git missing or too slow - retry next sweep
+    if status is None:
+        return None
+    changed, untracked, complete = status
+    return {
+        "index": key,
+        "checked_at": int(time.time()),
+        "changed": len(changed),
+        "untracked": len(untracked),
+        "complete": complete,
+    }
+
+
+def sweep(
+    repos: List[Tuple[str, Path]],
+    deadline: float = SWEEP_DEADLINE_SECONDS,
+    workers: int = MAX_WORKERS,
+) -> Tuple[List[DirtyRepo], int]:
+    """
+    Check `repos` for uncommitted changes within `deadline` seconds.
+
+    Returns (dirty repos, number of repos skipped because the deadline passed).
+    """
+    cache = _load_cache()
+    fresh: Dict[str, Any] = {}
+    pending: "queue.Queue[Tuple[str, Path, List[int]]]" = queue.Queue()
+
+    expired = time.time() - CACHE_MAX_AGE_SECONDS
+    for _, path in repos:
+        key = _index_key(path)
+        entry = cache.get(str(path))
+        if entry and entry.get("index") == key and entry.get("checked_at", 0) >= expired:
+            fresh[str(path)] = entry
+        else:
+            pending.put((str(path), path, key))
+
+    stale_count = pending.qsize()
+    stop_at = time.monotonic() + deadline
+    lock = threading.Lock()
+    done: List[str] = []
+
+    def worker() -> None:
+        while time.monotonic() < stop_at:
+            try:
+                path_str, path, key = pending.get_nowait()
+            except queue.Empty:
+                return
+            entry = _status_entry(path, key)
+            with lock:
+                if entry is not None:
+                    fresh[path_str] = entry
+                done.append(path_str)
+
+    # Daemon threads: a repo still running at the deadline must not hold up exit
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(min(workers, stale_count))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(max(0.0, stop_at - time.monotonic()))
+
+    with lock:
+        snapshot = dict(fresh)
+        skipped = stale_count - len(done)
+    if stale_count:
+        _save_cache(snapshot)  # Only repos seen in this sweep are kept
+
+    dirty = []
+    for name, path in repos:
+        entry = snapshot.get(str(path))
+        if entry and (entry.get("changed") or entry.get("untracked")):
+            dirty.append(DirtyRepo(
+                name,
+                str(path),
+                entry.get("changed", 0),
+                entry.get("untracked", 0),
+                entry.get("complete", True),
+            ))
+    dirty.sort(key=lambda r: r.changed + r.untracked, reverse=True)
+    return dirty, skipped
+
+
+if __name__ == "__main__":
+    # Quick test
+    limit = float(sys.argv[1]) if len(sys.argv) > 1 else SWEEP_DEADLINE_SECONDS
+    found = discover_repos()
+    start = time.monotonic()
+    dirty, skipped = sweep(found, deadline=limit)
+    print(f"Repos: {len(found)}, dirty: {len(dirty)}, skipped: {skipped}")
+    for repo in dirty:
+        print(f"  {repo.describe()}  {repo.path}")
+    print(f"Sweep: {(time.monotonic() - start) * 1000:.1f}ms")
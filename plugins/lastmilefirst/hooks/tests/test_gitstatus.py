@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for gitstatus.py.
+
+Run: python -m unittest discover -s plugins/lastmilefirst/hooks/tests
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import gitstatus
+
+
+@unittest.skipUnless(shutil.which("git"), "git not installed")
+class RunStatusTest(unittest.TestCase):
+    """run_status() counts must match `git status --porcelain`."""
+
+    def setUp(self) -> None:
+        self.repo = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.repo)
+        self.git("init", "-q")
+        self.git("config", "user.email", "test@example.com")
+        self.git("config", "user.name", "Test")
+        for name in ("tracked.txt", "other.txt"):
+            Path(self.repo, name).write_text("one\n")
+        self.git("add", ".")
+        self.git("commit", "-q", "-m", "initial")
+
+        # Two real changes and an empty directory, which git status ignores
+        Path(self.repo, "tracked.txt").write_text("two\n")
+        Path(self.repo, "new.txt").write_text("new\n")
+        os.mkdir(os.path.join(self.repo, "sub"))
+
+    def git(self, *args: str) -> str:
+        return subprocess.run(
+            ["git", *args], cwd=self.repo, check=True, capture_output=True, text=True
+        ).stdout
+
+    def porcelain_count(self) -> int:
+        return len([line for line in self.git("status", "--porcelain").splitlines() if line])
+
+    def test_empty_directory_is_not_untracked(self) -> None:
+        changed, untracked, complete = gitstatus.run_status(self.repo)
+        self.assertEqual(changed, [" M tracked.txt"])
+        self.assertEqual(untracked, ["new.txt"])
+        self.assertTrue(complete)
+        self.assertEqual(len(changed) + len(untracked), self.porcelain_count())
+
+    def test_fast_untracked_path_agrees(self) -> None:
+        self.git("config", "core.untrackedCache", "true")
+        changed, untracked, complete = gitstatus.run_status(self.repo)
+        self.assertEqual((changed, untracked, complete), ([" M tracked.txt"], ["new.txt"], True))
+
+
+
+@unittest.skipUnless(shutil.which("git"), "git not installed")
+class PathStatusTest(unittest.TestCase):
+    """get_path_status() reports exactly the given files, by their real names."""
+
+    def setUp(self) -> None:
+        self.repo = os.path.realpath(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.repo)
+        self.git("init", "-q")
+        self.git("config", "user.email", "test@example.com")
+        self.git("config", "user.name", "Test")
+        for name in ("a*.txt", "ab.txt", "café.txt", "old.txt"):
+            Path(self.repo, name).write_text("one\n")
+        self.git("add", ".")
+        self.git("commit", "-q", "-m", "initial")
+
+    def git(self, *args: str) -> str:
+        return subprocess.run(
+            ["git", *args], cwd=self.repo, check=True, capture_output=True, text=True
+        ).stdout
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.repo, name)
+
+    def test_glob_characters_match_literally(self) -> None:
+        Path(self.repo, "ab.txt").write_text("two\n")
+        self.assertEqual(gitstatus.get_path_status([self.path("a*.txt")]), {})
+        self.assertEqual(
+            gitstatus.get_path_status([self.path("ab.txt")]), {self.repo: [" M ab.txt"]}
+        )
+
+    def test_non_ascii_and_renamed_paths_are_unquoted(self) -> None:
+        Path(self.repo, "café.txt").write_text("two\n")
+        self.git("mv", "old.txt", "new.txt")
+        changes = gitstatus.get_path_status([self.path("café.txt"), self.path("new.txt"), self.path("old.txt")])
+        self.assertEqual(sorted(changes[self.repo]), [" M café.txt", "R  new.txt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Tests for hookd.py.
+
+Run: python -m unittest discover -s plugins/lastmilefirst/hooks/tests
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import hookd
+
+
+class RunRequestTest(unittest.TestCase):
+    """The daemon retires after a script that leaves threads behind."""
+
+    def setUp(self) -> None:
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+
+    def run_script(self, source: str) -> dict:
+        script = Path(self.dir, "hook.py")
+        script.write_text(source)
+        return hookd._run_request({
+            "script": str(script),
+            "args": [],
+            "cwd": self.dir,
+            "env": dict(os.environ),
+            "stdin": "",
+        })
+
+    def test_clean_script_keeps_daemon(self) -> None:
+        response = self.run_script("print('ok')\n")
+        self.assertEqual((response["returncode"], response["stdout"]), (0, "ok\n"))
+        self.assertNotIn("retire", response)
+
+    def test_leftover_thread_retires_daemon(self) -> None:
+        response = self.run_script(
+            "import threading\n"
+            "release = threading.Event()\n"
+            "threading.Thread(target=release.wait, args=(2,), daemon=True).start()\n"
+            "print('ok')\n"
+        )
+        self.assertEqual((response["returncode"], response["stdout"]), (0, "ok\n"))
+        self.assertTrue(response.get("retire"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Tests for invocations.py.
+
+Run: python -m unittest discover -s plugins/lastmilefirst/hooks/tests
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import invocations
+from overwatch import STORE_ENV
+
+DAY = 86400
+
+
+class UsageWindowTest(unittest.TestCase):
+    """load_usage_counts() windows are whole UTC days."""
+
+    def setUp(self) -> None:
+        home = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, home)
+        patcher = mock.patch.dict(os.environ, {"HOME": home})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        os.environ.pop(invocations.RAW_LOG_ENV, None)
+
+        # One invocation at noon on each of the last 10 days, today included
+        self.today = int(time.time()) // DAY * DAY
+        for days_ago in range(10):
+            invocations.append_invocation("skill", self.today - days_ago * DAY + DAY // 2)
+
+    def count_since(self, since: int) -> int:
+        counts, _ = invocations.load_usage_counts(since)
+        return counts.get("skill", 0)
+
+    def test_partial_first_day_is_excluded(self) -> None:
+        # Cutoff in the middle of the day 7 days ago: 7 calendar days, not 8
+        self.assertEqual(self.count_since(self.today - 7 * DAY + 3600), 7)
+
+    def test_cutoff_at_midnight_includes_that_day(self) -> None:
+        self.assertEqual(self.count_since(self.today - 6 * DAY), 7)
+
+    def test_compacted_counters_use_the_same_window(self) -> None:
+        invocations.prune_invocations()
+        self.assertEqual(self.count_since(self.today - 7 * DAY + 3600), 7)
+        self.assertEqual(self.count_since(self.today - 6 * DAY), 7)
+
+
+
+class TornRecordTest(unittest.TestCase):
+    """A partial record in a segment only loses that record."""
+
+    def setUp(self) -> None:
+        home = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, home)
+        patcher = mock.patch.dict(os.environ, {"HOME": home})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        os.environ.pop(invocations.RAW_LOG_ENV, None)
+        os.environ.pop(STORE_ENV, None)  # Segments are file-store only
+        self.now = int(time.time())
+
+    def append_torn(self, name: str) -> None:
+        record = invocations.InvocationRecord(self.now, name, "skill", 5, "session")
+        encoded = invocations._encode_record(record)
+        invocations._append_bytes(invocations.get_segment_file(self.now), encoded[:len(encoded) // 2])
+
+    def test_records_around_a_torn_record_survive(self) -> None:
+        for _ in range(3):
+            invocations.append_invocation("before", self.now, kind="skill", session_id="s1")
+        self.append_torn("torn-" + "x" * 100)
+        for _ in range(2):
+            invocations.append_invocation("after", self.now, kind="agent", session_id="s2")
+
+        counts, _ = invocations.load_usage_counts(0)
+        self.assertEqual(counts, {"before": 3, "after": 2})
+        kinds = {record.name: record.kind for record in invocations.iter_file_invocations(0)}
+        self.assertEqual(kinds, {"before": "skill", "after": "agent"})
+
+    def test_truncated_tail_is_ignored(self) -> None:
+        invocations.append_invocation("kept", self.now)
+        self.append_torn("lost")
+        counts, _ = invocations.load_usage_counts(0)
+        self.assertEqual(counts, {"kept": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Tests for record_change.py.
+
+Run: python -m unittest discover -s plugins/lastmilefirst/hooks/tests
+"""
+
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import record_change
+from overwatch import get_tmp_dir
+
+
+class RecordChangeTest(unittest.TestCase):
+    """record_change.py appends edited paths and ignores empty payloads."""
+
+    def setUp(self) -> None:
+        home = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, home)
+        patcher = mock.patch.dict(os.environ, {"HOME": home})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_hook(self, stdin: str) -> None:
+        with mock.patch.object(sys, "stdin", io.StringIO(stdin)), mock.patch.object(sys, "argv", ["record_change.py"]):
+            record_change.main()
+
+    def test_edits_are_appended(self) -> None:
+        payload = json.dumps({"session_id": "s1", "cwd": "/work", "tool_input": {"file_path": "a.txt"}})
+        self.run_hook(payload)
+        self.run_hook(payload)
+        log = get_tmp_dir() / "session-changes-s1.log"
+        self.assertEqual(log.read_text().splitlines(), ["/work/a.txt", "/work/a.txt"])
+
+    def test_empty_payload_writes_nothing(self) -> None:
+        self.run_hook("")
+        self.assertEqual(list(get_tmp_dir().iterdir()), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
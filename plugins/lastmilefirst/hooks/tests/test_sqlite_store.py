@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Tests for sqlite_store.py.
+
+Run: python -m unittest discover -s plugins/lastmilefirst/hooks/tests
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import sqlite_store
+from overwatch import get_invocations_file
+
+
+class ImportFileStoreTest(unittest.TestCase):
+    """The file store is imported into a new database exactly once."""
+
+    def setUp(self) -> None:
+        home = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, home)
+        patcher = mock.patch.dict(os.environ, {"HOME": home})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        now = int(time.time())
+        with open(get_invocations_file(), "w", encoding="utf-8") as f:
+            f.writelines(f"{now - i}|skill{i % 3}\n" for i in range(50))
+
+    def count_in_fresh_connection(self) -> int:
+        result = []
+
+        def run() -> None:
+            conn = sqlite_store._connect()
+            result.append(conn.execute("SELECT COUNT(*) FROM invocations").fetchone()[0])
+            conn.close()
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+        return result[0]
+
+    def test_concurrent_first_connections_import_once(self) -> None:
+        threads = [threading.Thread(target=sqlite_store._connect) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.count_in_fresh_connection(), 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
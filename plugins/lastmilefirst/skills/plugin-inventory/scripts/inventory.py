@@ -13,6 +13,9 @@ import time
 from datetime import datetime
 from pathlib import Path
 
+# Path to Overwatch hook scripts (owns the invocation log format)
+OVERWATCH_SCRIPTS = Path(__file__).parent.parent.parent.parent / "hooks" / "scripts"
+
 
 def get_claude_dir() -> Path:
     """Get the Claude configuration directory."""
@@ -107,40 +110,30 @@ def count_agents(install_path: Path) -> int:
     return len(list(agents_dir.glob("*.md")))
 
 
-def load_invocations(days: int = 7) -> list[tuple[int, str]]:
-    """Load invocations from the log file within the specified days."""
-    invocations_file = get_claude_dir() / "lastmilefirst" / "invocations.log"
-    if not invocations_file.exists():
-        return []
+def load_usage(days: int = 7) -> tuple[dict[str, int], int]:
+    """
+    Load per-skill invocation counts for the last N days.
+
+    Reads the Overwatch per-day counters, so cost is O(days) rather than
+    O(events). Returns (counts by skill, timestamp of last invocation).
+    """
+    if not OVERWATCH_SCRIPTS.exists():
+        return {}, 0
 
     cutoff = int(time.time()) - (days * 24 * 60 * 60)
-    invocations = []
 
     try:
-        with open(invocations_file, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if "|" in line:
-                    parts = line.split("|", 1)
-                    if len(parts) == 2:
-                        try:
-                            timestamp = int(parts[0])
-                            if timestamp >= cutoff:
-                                invocations.append((timestamp, parts[1]))
-                        except ValueError:
-                            continue
-    except IOError:
-        return []
+        sys.path.insert(0, str(OVERWATCH_SCRIPTS))
+        from invocations import load_usage_counts
 
-    return invocations
-
-
-def aggregate_invocations(invocations: list[tuple[int, str]]) -> dict[str, int]:
-    """Aggregate invocations by skill name."""
-    counts: dict[str, int] = {}
-    for _, skill_name in invocations:
-        counts[skill_name] = counts.get(skill_name, 0) + 1
-    return counts
+        return load_usage_counts(since=cutoff)
+    except ImportError:
+        return {}, 0
+    except IOError:
+        return {}, 0
+    finally:
+        if str(OVERWATCH_SCRIPTS) in sys.path:
+            sys.path.remove(str(OVERWATCH_SCRIPTS))
 
 
 def format_time_ago(timestamp: int) -> str:
@@ -177,7 +170,8 @@ def print_separator(char: str = "─", width: int = 60) -> None:
 
 def print_inventory(
     plugins: dict,
-    invocations: list[tuple[int, str]],
+    aggregated: dict[str, int],
+    last_invocation: int = 0,
     verbose: bool = False,
     show_usage: bool = False,
     days: int = 7,
@@ -188,9 +182,7 @@ def print_inventory(
     print_separator()
     print()
 
-    aggregated = aggregate_invocations(invocations)
-    total_invocations = len(invocations)
-    last_invocation = max((ts for ts, _ in invocations), default=0) if invocations else 0
+    total_invocations = sum(aggregated.values())
 
     plugin_count = 0
 
@@ -308,17 +300,16 @@ def print_inventory(
 
 def print_json(
     plugins: dict,
-    invocations: list[tuple[int, str]],
+    aggregated: dict[str, int],
     days: int = 7,
 ) -> None:
     """Print the plugin inventory as JSON."""
-    aggregated = aggregate_invocations(invocations)
 
     output = {
         "plugins": [],
         "usage": {
             "days": days,
-            "total_invocations": len(invocations),
+            "total_invocations": sum(aggregated.values()),
             "by_skill": aggregated,
         },
     }
@@ -401,14 +392,15 @@ def main() -> None:
 
     # Load data
     plugins = load_installed_plugins()
-    invocations = load_invocations(days=args.since)
+    aggregated, last_invocation = load_usage(days=args.since)
 
     if args.json:
-        print_json(plugins, invocations, days=args.since)
+        print_json(plugins, aggregated, days=args.since)
     else:
         print_inventory(
             plugins,
-            invocations,
+            aggregated,
+            last_invocation,
             verbose=args.verbose,
             show_usage=args.usage,
             days=args.since,
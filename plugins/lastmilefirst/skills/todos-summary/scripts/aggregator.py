@@ -11,20 +11,53 @@ Terminology (consistent with organize-claude):
 - Project: A single project directory within an org
 """
 
+import hashlib
+import heapq
+import io
 import json
+import marshal
 import os
+import queue
 import re
+import struct
+import threading
 import time
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, TextIO, Tuple
 
 
 # Configuration paths
 WORKSPACE_CONFIG = Path.home() / ".claude" / "workspace-config.json"
 CACHE_DIR = Path.home() / ".claude" / "cache"
-CACHE_FILE = CACHE_DIR / "todo-aggregator.json"
-CACHE_TTL_SECONDS = 300  # 5 minutes
+CACHE_PARTITION_DIR = CACHE_DIR / "todo-aggregator"  # One index file per org
+LEGACY_CACHE_FILE = CACHE_DIR / "todo-aggregator.json"  # Single-file cache, removed on first save
+CACHE_VERSION = 4  # Bump when the index entry layout changes
+CACHE_MAGIC = b"TODOIDX\0"
+CACHE_FORMATS = ("marshal", "json")
+
+# A directory listing is only trusted if the directory's mtime is at least this
+# much older than the listing, so a change in the same timestamp tick is not missed
+RACY_MTIME_NS = 2_000_000_000
+
+DEFAULT_WORKERS = 1
+
+# Inline [BLOCKS:project] and [BLOCKED-BY:project#id] tags
+INLINE_TAG_RE = re.compile(r"\[(BLOCKS|BLOCKED-BY):([^\]]+)\]")
+
+# Header-only parsing: frontmatter and title come from the first N KB (0 = whole file)
+DEFAULT_HEADER_KB = 64
+TAIL_CHUNK_BYTES = 64 * 1024
+
+# Todo states, in display order
+STATES = ("urgent", "blocked", "active", "stale")
+
+# Inverted index fields, as (name, index entry position); see update_terms()
+TERM_FIELDS = (("project", 2), ("priority", 5), ("blocker", 7), ("tag", 8))
+
+# Ranking for --limit: lower is more important; unknown priorities rank as "normal"
+PRIORITY_RANK = {"urgent": 0, "p1": 0, "high": 0, "p2": 1, "medium": 1, "normal": 2, "p3": 3, "low": 3}
 
 
 @dataclass
@@ -72,9 +105,9 @@ class TodoItem:
     def is_stale(self) -> bool:
         return self.age_days > 7
 
-    @property
+    @cached_property
     def state(self) -> str:
-        """Computed state: urgent, blocked, active, stale."""
+        """Computed state: urgent, blocked, active, stale. Cached on first access."""
         if self.is_urgent:
             return "urgent"
         if self.is_blocked:
@@ -98,16 +131,116 @@ class TodoItem:
         }
 
 
+@dataclass
+class OrgView:
+    """
+    One org's todos bucketed by state and by project.
+
+    Built in a single pass (see build_views) and shared by the formatters.
+    Buckets keep aggregation order; projects are in order of first appearance.
+    """
+
+    todos: List[TodoItem]
+    by_state: Dict[str, List[TodoItem]]
+    by_project: Dict[str, Dict[str, List[TodoItem]]]  # Project -> state -> todos
+    open_count: int  # Todos whose status is not "complete"
+
+    @classmethod
+    def from_todos(cls, todos: List[TodoItem]) -> "OrgView":
+        by_state: Dict[str, List[TodoItem]] = {state: [] for state in STATES}
+        by_project: Dict[str, Dict[str, List[TodoItem]]] = {}
+        open_count = 0
+        for todo in todos:
+            state = todo.state
+            by_state[state].append(todo)
+            buckets = by_project.get(todo.project)
+            if buckets is None:
+                buckets = by_project[todo.project] = {s: [] for s in STATES}
+            buckets[state].append(todo)
+            if todo.status != "complete":
+                open_count += 1
+        return cls(todos, by_state, by_project, open_count)
+
+    def project_todos(self, project: str) -> List[TodoItem]:
+        """A project's todos ordered urgent, blocked, active, stale."""
+        buckets = self.by_project[project]
+        return [todo for state in STATES for todo in buckets[state]]
+
+
+@dataclass
+class TodoQuery:
+    """
+    Filters pushed down into the scan (see TodoAggregator.iter_todos).
+
+    Empty fields match everything; each field matches any of its values.
+    Projects are skipped before their todos directory is listed, and files
+    too recent for `older_than_days` before they are read or parsed.
+    """
+
+    states: Set[str] = field(default_factory=set)
+    tags: Set[str] = field(default_factory=set)
+    projects: Set[str] = field(default_factory=set)
+    priorities: Set[str] = field(default_factory=set)
+    blocked_by: Set[str] = field(default_factory=set)
+    older_than_days: int = 0
+    limit: int = 0  # Keep only the top N by rank_todo(); 0 = all
+
+    def wants_project(self, name: str) -> bool:
+        return not self.projects or name in self.projects
+
+    def wants_mtime(self, mtime_ns: int, now: float) -> bool:
+        return not self.older_than_days or mtime_ns <= (now - self.older_than_days * 86400) * 1e9
+
+    def matches(self, todo: TodoItem) -> bool:
+        return (
+            (not self.tags or not self.tags.isdisjoint(todo.tags))
+            and (not self.priorities or todo.priority in self.priorities)
+            and (not self.blocked_by or not self.blocked_by.isdisjoint(todo.blocked_by))
+            and (not self.states or todo.state in self.states)
+            and self.wants_project(todo.project)
+        )
+
+    def term_filters(self) -> List[Tuple[str, Set[str]]]:
+        """(inverted index field, wanted values) for the fields this query restricts."""
+        wanted = {"project": self.projects, "priority": self.priorities, "blocker": self.blocked_by, "tag": self.tags}
+        return [(name, wanted[name]) for name, _ in TERM_FIELDS if wanted[name]]
+
+
+def rank_todo(todo: TodoItem) -> Tuple[int, int]:
+    """Sort key for --limit: most urgent priority first, then oldest."""
+    return (0 if todo.is_urgent else PRIORITY_RANK.get(todo.priority, 2), -todo.age_days)
+
+
+def top_todos(items: Iterable[Tuple[str, TodoItem]], limit: int) -> List[Tuple[str, TodoItem]]:
+    """The `limit` best-ranked (org name, todo) pairs, in rank order, keeping a heap of `limit` items."""
+    return heapq.nsmallest(limit, items, key=lambda item: rank_todo(item[1]))
+
+
+def build_views(data: Dict[str, List[TodoItem]]) -> Dict[str, OrgView]:
+    """Bucket aggregated todos (org name -> todos) once for all formatters."""
+    return {org_name: OrgView.from_todos(todos) for org_name, todos in data.items()}
+
+
 class TodoAggregator:
     """Aggregates todos across projects in workspace orgs."""
 
-    def __init__(self, exclude_patterns: Optional[List[str]] = None):
+    def __init__(self, exclude_patterns: Optional[List[str]] = None, workers: Optional[int] = None):
         self.exclude_patterns = exclude_patterns or [
             "node_modules", ".git", "venv", "__pycache__", ".venv"
         ]
+        self.workers = DEFAULT_WORKERS  # Threads for scanning projects; 1 = serial
+        self.header_bytes = DEFAULT_HEADER_KB * 1024  # 0 = parse whole files
+        self.cache_format = "marshal"  # Index encoding, see dump_index()
         self._workspace_path: Optional[Path] = None
         self._orgs: List[OrgConfig] = []
+        self._dirs: Dict[str, Sequence[Any]] = {}  # Path -> (mtime_ns, listed_ns, names)
+        self._visited_dirs: Set[str] = set()
+        self.discovery_stats: Dict[str, int] = {}
+        self._stats_lock = threading.Lock()
+        self._reset_stats()
         self._load_config()
+        if workers is not None:
+            self.workers = max(1, workers)
 
     def _load_config(self) -> None:
         """Load workspace and org configuration from file."""
@@ -140,6 +273,18 @@ class TodoAggregator:
             if "exclude_patterns" in data:
                 self.exclude_patterns = data["exclude_patterns"]
 
+            # Concurrent scanning (useful on network-mounted home directories)
+            if isinstance(data.get("workers"), int):
+                self.workers = max(1, data["workers"])
+
+            # Header-only parsing of large todo files
+            if isinstance(data.get("header_kb"), int):
+                self.header_bytes = max(0, data["header_kb"]) * 1024
+
+            # Index encoding
+            if data.get("cache_format") in CACHE_FORMATS:
+                self.cache_format = data["cache_format"]
+
         except (json.JSONDecodeError, IOError) as e:
             print(f"Warning: Failed to load workspace config: {e}")
             self._workspace_path = Path.home() / "Code"
@@ -166,23 +311,72 @@ class TodoAggregator:
                 return org
         return None
 
+    def _reset_stats(self) -> None:
+        self.discovery_stats = {
+            "dirs_listed": 0,
+            "dirs_skipped": 0,
+            "files_parsed": 0,
+            "files_indexed": 0,
+            "files_filtered": 0,  # Skipped by a TodoQuery without being read
+        }
+
+    def _count(self, counter: str) -> None:
+        with self._stats_lock:
+            self.discovery_stats[counter] += 1
+
+    def _cached_listing(self, directory: Path, list_names: Callable[[Path], List[str]]) -> List[str]:
+        """
+        Names in `directory`, re-listed only when its mtime has changed.
+
+        Adding, removing or renaming an entry updates a directory's mtime, so
+        an unchanged mtime means the previous listing is still valid.
+        """
+        key = str(directory)
+        self._visited_dirs.add(key)
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            self._dirs.pop(key, None)
+            return []
+
+        entry = self._dirs.get(key)
+        if entry and entry[0] == mtime_ns and mtime_ns + RACY_MTIME_NS <= entry[1]:
+            self._count("dirs_skipped")
+            return entry[2]
+
+        listed_ns = time.time_ns()
+        try:
+            names = list_names(directory)
+        except OSError:
+            names = []
+        self._dirs[key] = (mtime_ns, listed_ns, names)
+        self._count("dirs_listed")
+        return names
+
+    @staticmethod
+    def _list_subdirs(directory: Path) -> List[str]:
+        with os.scandir(directory) as entries:
+            return sorted(e.name for e in entries if not e.name.startswith(".") and e.is_dir())
+
+    @staticmethod
+    def _list_markdown(directory: Path) -> List[str]:
+        with os.scandir(directory) as entries:
+            return [
+                e.name for e in entries
+                if not e.name.startswith(".") and e.name.endswith(".md") and e.is_file()
+            ]
+
     def discover_projects(self, org: OrgConfig) -> List[Path]:
         """Discover all projects in an org that have .claude/work/todos."""
         projects = []
 
-        if not org.path.exists():
-            return projects
-
-        for item in sorted(org.path.iterdir()):
-            if not item.is_dir():
-                continue
-            if item.name.startswith("."):
-                continue
-            if item.name in self.exclude_patterns:
+        for name in self._cached_listing(org.path, self._list_subdirs):
+            if name in self.exclude_patterns:
                 continue
 
+            item = org.path / name
             todos_dir = item / ".claude" / "work" / "todos"
-            if todos_dir.exists() and todos_dir.is_dir():
+            if todos_dir.is_dir():
                 projects.append(item)
 
         return projects
@@ -190,8 +384,9 @@ class TodoAggregator:
     def parse_todo_file(self, file_path: Path, project_name: str) -> Optional[TodoItem]:
         """Parse a single todo file and extract metadata."""
         try:
-            content = file_path.read_text(encoding="utf-8")
-        except IOError:
+            with open(file_path, "rb") as f:
+                frontmatter, title, inline_blocks, inline_blocked_by = self._read_todo(f)
+        except (IOError, UnicodeDecodeError):
             return None
 
         # Calculate age
@@ -201,14 +396,9 @@ class TodoAggregator:
         except OSError:
             age_days = 0
 
-        # Extract YAML frontmatter
-        frontmatter = self._parse_frontmatter(content)
-
-        # Extract title (first markdown heading or filename)
-        title = self._extract_title(content, file_path)
-
-        # Parse inline tags
-        inline_blocks, inline_blocked_by = self._parse_inline_tags(content)
+        # Fall back to filename when there is no heading
+        if title is None:
+            title = file_path.stem.replace("-", " ").replace("_", " ").title()
 
         return TodoItem(
             project=project_name,
@@ -222,6 +412,110 @@ class TodoAggregator:
             tags=frontmatter.get("tags", []),
         )
 
+    def _read_todo(self, f: BinaryIO) -> Tuple[Dict[str, Any], Optional[str], List[str], List[str]]:
+        """
+        Extract (frontmatter, title or None, blocks, blocked_by) from an open todo file.
+
+        In header-only mode (header_bytes > 0) only the first header_bytes,
+        cut at a line boundary, are decoded and parsed. The remainder is read
+        in chunks and only decoded where a byte search finds "[BLOCK", so
+        large pasted logs are never held in memory. If the frontmatter or
+        first heading doesn't fit in the header, the whole file is parsed.
+        """
+        blocks: List[str] = []
+        blocked_by: List[str] = []
+
+        if self.header_bytes:
+            header = f.read(self.header_bytes)
+            whole = len(header) < self.header_bytes
+            cut = len(header) if whole else header.rfind(b"\n") + 1
+            if cut:
+                # Decoded incrementally, so the header is never held as one str
+                stream = io.TextIOWrapper(io.BytesIO(header[:cut]), encoding="utf-8")
+                frontmatter, title, settled = self._scan_header(stream, blocks, blocked_by)
+                _collect_inline_tags(stream.read(), blocks, blocked_by)
+                if whole or settled:
+                    if not whole:
+                        carry = header[cut:]
+                        del header, stream
+                        self._scan_tail(f, carry, blocks, blocked_by)
+                    return frontmatter, title, blocks, blocked_by
+                del blocks[:], blocked_by[:]
+            f.seek(0)
+
+        stream = io.TextIOWrapper(f, encoding="utf-8")
+        frontmatter, title, _ = self._scan_header(stream, blocks, blocked_by)
+        _collect_inline_tags(stream.read(), blocks, blocked_by)
+        return frontmatter, title, blocks, blocked_by
+
+    def _scan_header(
+        self,
+        f: TextIO,
+        blocks: List[str],
+        blocked_by: List[str],
+    ) -> Tuple[Dict[str, Any], Optional[str], bool]:
+        """
+        Single pass over the start of a todo file: frontmatter, first heading
+        and any inline tags on the lines read.
+
+        Reads line by line and stops right after the first heading, leaving
+        the rest of `f` unread. Returns (frontmatter, title or None, settled);
+        settled is False when `f` ran out before the frontmatter closed or a
+        heading was found, i.e. more input could change the result.
+        """
+        frontmatter: Dict[str, Any] = {}
+        settled = True
+        head = f.readline()
+        body = head
+        if head.startswith("---"):
+            # Frontmatter ends at the next "---", which may sit on any later line
+            end_marker = head.find("---", 3)
+            while end_marker == -1:
+                line = f.readline()
+                if not line:
+                    settled = False  # Unclosed: no frontmatter, the whole file is body
+                    break
+                searched = max(3, len(head) - 2)
+                head += line
+                end_marker = head.find("---", searched)
+            if end_marker != -1:
+                frontmatter = self._parse_frontmatter(head)
+                body = head[end_marker + 3:]
+            else:
+                body = head
+        _collect_inline_tags(head, blocks, blocked_by)
+
+        # First heading, continuing into the rest of the file if needed
+        for line in body.split("\n"):
+            line = line.strip()
+            if line.startswith("#"):
+                return frontmatter, line.lstrip("#").strip(), settled
+        while True:
+            line = f.readline()
+            if not line:
+                return frontmatter, None, False
+            _collect_inline_tags(line, blocks, blocked_by)
+            line = line.strip()
+            if line.startswith("#"):
+                return frontmatter, line.lstrip("#").strip(), settled
+
+    def _scan_tail(self, f: BinaryIO, carry: bytes, blocks: List[str], blocked_by: List[str]) -> None:
+        """Collect inline tags from the rest of the file, decoding only chunks that contain "[BLOCK"."""
+        while True:
+            chunk = f.read(TAIL_CHUNK_BYTES)
+            data = carry + chunk
+            if chunk:
+                # Keep the trailing partial line for the next chunk so tags aren't split
+                cut = data.rfind(b"\n") + 1
+                if not cut:
+                    carry = data
+                    continue
+                data, carry = data[:cut], data[cut:]
+            if b"[BLOCK" in data:
+                _collect_inline_tags(data.decode("utf-8", "replace"), blocks, blocked_by)
+            if not chunk:
+                return
+
     def _parse_frontmatter(self, content: str) -> Dict[str, Any]:
         """Parse YAML frontmatter from content."""
         if not content.startswith("---"):
@@ -253,140 +547,512 @@ class TodoAggregator:
 
         return result
 
-    def _extract_title(self, content: str, file_path: Path) -> str:
-        """Extract title from content or filename."""
-        # Skip frontmatter
-        if content.startswith("---"):
-            end_marker = content.find("---", 3)
-            if end_marker != -1:
-                content = content[end_marker + 3:].strip()
-
-        # Look for first heading
-        for line in content.split("\n"):
-            line = line.strip()
-            if line.startswith("#"):
-                return line.lstrip("#").strip()
-
-        # Fall back to filename
-        return file_path.stem.replace("-", " ").replace("_", " ").title()
-
-    def _parse_inline_tags(self, content: str) -> tuple[List[str], List[str]]:
-        """Parse inline [BLOCKS:...] and [BLOCKED-BY:...] tags."""
-        blocks = []
-        blocked_by = []
-
-        # Find [BLOCKS:project]
-        for match in re.finditer(r"\[BLOCKS:([^\]]+)\]", content):
-            blocks.append(match.group(1).strip())
-
-        # Find [BLOCKED-BY:project#id] or [BLOCKED-BY:project]
-        for match in re.finditer(r"\[BLOCKED-BY:([^\]]+)\]", content):
-            blocked_by.append(match.group(1).strip())
-
-        return blocks, blocked_by
+    def select_orgs(self, org: Optional[OrgConfig] = None, all_orgs: bool = False) -> List[OrgConfig]:
+        """Orgs to scan: all of them, the given one, or the default org."""
+        if all_orgs:
+            return list(self._orgs)
+        if org:
+            return [org]
+        default = self.get_default_org()
+        return [default] if default else []
 
     def aggregate_todos(
         self,
         org: Optional[OrgConfig] = None,
         all_orgs: bool = False,
         use_cache: bool = True,
+        query: Optional[TodoQuery] = None,
+        from_index: bool = False,
     ) -> Dict[str, List[TodoItem]]:
         """
-        Aggregate todos from projects.
+        Aggregate todos from projects (see iter_todos), or with from_index=True
+        answer from the persisted index without scanning (see lookup_todos).
+
+        With a query limit, only the top-ranked todos are kept (see rank_todo),
+        each org's list in rank order.
 
         Returns dict mapping org name to list of TodoItems.
         """
-        # Check cache
-        if use_cache:
-            cached = self._load_cache()
-            if cached is not None:
-                return cached
+        orgs_to_scan = self.select_orgs(org, all_orgs)
+        result: Dict[str, List[TodoItem]] = {org_config.name: [] for org_config in orgs_to_scan}
+        items: Iterable[Tuple[str, TodoItem]]
+        if from_index:
+            items = self.lookup_todos(orgs_to_scan, query)
+        else:
+            items = self.iter_todos(orgs_to_scan, use_cache=use_cache, query=query)
+        if query and query.limit:
+            items = top_todos(items, query.limit)
+        for org_name, todo in items:
+            result[org_name].append(todo)
+        return result
 
-        result: Dict[str, List[TodoItem]] = {}
+    def iter_todos(
+        self,
+        orgs: List[OrgConfig],
+        filter: Optional[Callable[[TodoItem], bool]] = None,
+        use_cache: bool = True,
+        query: Optional[TodoQuery] = None,
+    ) -> Iterator[Tuple[str, TodoItem]]:
+        """
+        Yield (org name, todo) for every open todo in `orgs` that passes
+        `filter` and `query`, project by project. The query's limit is not
+        applied here (see aggregate_todos).
+
+        Files are looked up in a persistent per-file index keyed by path and
+        (mtime_ns, size): only new or changed files are re-parsed, and entries
+        for deleted files in the scanned orgs are dropped. Org and todos
+        directories whose mtime is unchanged are not re-listed (see
+        discovery_stats). With use_cache=False every directory in the scanned
+        orgs is listed and every file re-parsed.
+
+        Items are yielded as each project's scan finishes, in discovery order.
+        Consumers may stop early (break, or close() the generator): projects
+        not reached are never scanned. The index partitions are saved when the
+        generator finishes or is closed; after an early exit, entries for
+        projects that were not reached (or were filtered out) are kept as they were.
+        """
+        # Each org has its own index partition; --all composes them
+        index: Dict[str, Sequence[Any]] = {}
+        previous: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._dirs = {}
+        for org_config in orgs:
+            partition = self._load_cache(org_config)
+            previous[org_config.name] = partition
+            index.update(partition["files"])
+            if use_cache:
+                self._dirs.update(partition["dirs"])
+        self._visited_dirs = set()
+        self._reset_stats()
+        now = time.time()
+
+        # Projects are scanned concurrently when workers > 1; results come back
+        # in discovery order, so output matches a serial scan
+        jobs = []
+        skipped_projects = False
+        for org_config in orgs:
+            for project_path in self.discover_projects(org_config):
+                if query and not query.wants_project(project_path.name):
+                    skipped_projects = True
+                else:
+                    jobs.append((org_config.name, project_path))
+
+        def scan(project_path: Path) -> List[Tuple[str, Optional[Sequence[Any]], bool]]:
+            return self._scan_project(project_path, index, use_cache, query, now)
+
+        files_by_org: Dict[str, Dict[str, Sequence[Any]]] = {org_config.name: {} for org_config in orgs}
+        scanned_dirs: Set[str] = set()  # Todos dirs whose entries are all in files_by_org
+        finished = False
+        paths = [path for _, path in jobs]
+        threaded = scan_in_order(scan, paths, self.workers) if self.workers > 1 and len(jobs) > 1 else None
+        scanned = threaded if threaded is not None else map(scan, paths)
+        try:
+            for (org_name, project_path), entries in zip(jobs, scanned):
+                # Record the whole project before yielding, so an early exit
+                # never leaves a project half-recorded in the index
+                todos = []
+                for key, entry, wanted in entries:
+                    if entry is None:
+                        continue  # Unreadable, or filtered out and not indexed yet
+                    files_by_org[org_name][key] = entry
+                    if not wanted:
+                        continue
+                    todo = self._todo_from_entry(key, entry, now)
+                    if (
+                        todo.status != "complete"
+                        and (filter is None or filter(todo))
+                        and (query is None or query.matches(todo))
+                    ):
+                        todos.append(todo)
+                scanned_dirs.add(str(project_path / ".claude" / "work" / "todos"))
 
-        if all_orgs:
-            orgs_to_scan = self._orgs
-        elif org:
-            orgs_to_scan = [org]
-        else:
-            default = self.get_default_org()
-            orgs_to_scan = [default] if default else []
+                for todo in todos:
+                    yield org_name, todo
+            finished = True
+        finally:
+            if threaded is not None:
+                threaded.close()  # Stops the workers once their current project is done
+            self._save_scanned(orgs, files_by_org, previous, scanned_dirs, finished and not skipped_projects)
 
-        for org_config in orgs_to_scan:
-            todos = []
-            projects = self.discover_projects(org_config)
+    def lookup_todos(self, orgs: List[OrgConfig], query: Optional[TodoQuery] = None) -> Iterator[Tuple[str, TodoItem]]:
+        """
+        Yield (org name, todo) for open todos matching `query`, answered from
+        the persisted index instead of a scan.
+
+        Every indexed file is stat'ed first: changed files are re-parsed and
+        deleted ones dropped, and the partition and its inverted index are
+        saved if anything changed (see _refresh_partition). Tag, priority,
+        blocker and project filters then intersect the posting lists, so only
+        matching entries become todos. Directories are not listed, so todo
+        files created since the last scan are not seen. Items are in path
+        order; the query's limit is not applied here (see aggregate_todos).
+        """
+        self._reset_stats()
+        now = time.time()
+        for org_config in orgs:
+            partition = self._load_cache(org_config)
+            self._refresh_partition(org_config, partition)
+            files = partition["files"]
+            paths = lookup_paths(partition["terms"], query) if query else None
+            for path in sorted(files if paths is None else paths):
+                entry = files.get(path)
+                if entry is None:
+                    continue
+                todo = self._todo_from_entry(path, entry, now)
+                if todo.status != "complete" and (query is None or (
+                    query.wants_mtime(entry[0], now) and query.matches(todo)
+                )):
+                    yield org_config.name, todo
+
+    def _refresh_partition(self, org: OrgConfig, partition: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Bring an org's indexed entries up to date without listing directories:
+        re-parse files whose (mtime_ns, size) changed, drop deleted or unreadable
+        ones, then update the inverted index and save if anything changed.
+        """
+        old_files = partition["files"]
+        files: Dict[str, Sequence[Any]] = {}
+        changed = False
+        for path, entry in old_files.items():
+            try:
+                st = os.stat(path)
+            except OSError:
+                changed = True  # Deleted
+                continue
+            if entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+                self._count("files_indexed")
+                files[path] = entry
+                continue
+            changed = True
+            self._count("files_parsed")
+            todo = self.parse_todo_file(Path(path), entry[2])
+            if todo:
+                files[path] = self._index_entry(todo, st)
+
+        if changed:
+            partition["terms"] = update_terms(partition["terms"], old_files, files)
+            partition["files"] = files
+            self._save_cache(org, partition)
+
+    def _save_scanned(
+        self,
+        orgs: List[OrgConfig],
+        files_by_org: Dict[str, Dict[str, Sequence[Any]]],
+        previous: Dict[str, Dict[str, Dict[str, Any]]],
+        scanned_dirs: Set[str],
+        finished: bool,
+    ) -> None:
+        """
+        Save each scanned org's partition. After a full scan it holds exactly
+        what the scan saw, which drops deleted files and directories; after an
+        early exit or with projects filtered out, the previous entries outside
+        `scanned_dirs` are merged back. The inverted index is updated for the
+        entries that changed. Other orgs' partitions are untouched.
+        """
+        for org_config in orgs:
+            root = str(org_config.path)
+            prefix = root + os.sep
+            dirs = {
+                key: listing for key, listing in self._dirs.items()
+                if key in self._visited_dirs and (key == root or key.startswith(prefix))
+            }
+            old = previous[org_config.name]
+            files = files_by_org[org_config.name]
+            if not finished:
+                dirs = {**old["dirs"], **dirs}
+                files = {
+                    **{
+                        key: entry for key, entry in old["files"].items()
+                        if os.path.dirname(key) not in scanned_dirs
+                    },
+                    **files,
+                }
+            terms = update_terms(old["terms"], old["files"], files)
+            self._save_cache(org_config, {"files": files, "dirs": dirs, "terms": terms})
+
+    def _scan_project(
+        self,
+        project_path: Path,
+        index: Dict[str, Sequence[Any]],
+        use_cache: bool,
+        query: Optional[TodoQuery] = None,
+        now: float = 0.0,
+    ) -> List[Tuple[str, Optional[Sequence[Any]], bool]]:
+        """
+        Index entries for one project's todo files, in listing order, as
+        (path, entry, wanted).
+
+        Files whose (mtime_ns, size) match the index reuse their entry; others
+        are parsed. The entry is None for files that could not be read.
+        Files too recent for the query are not wanted and never parsed; they
+        keep whatever entry the index had, for later unfiltered scans.
+        Runs on worker threads: reads `index` but never modifies it.
+        """
+        project_name = project_path.name
+        todos_dir = project_path / ".claude" / "work" / "todos"
+        entries: List[Tuple[str, Optional[Sequence[Any]], bool]] = []
+
+        for todo_file, st in self._list_todo_files(todos_dir):
+            key = str(todo_file)
+            entry = index.get(key)
+            if query and not query.wants_mtime(st.st_mtime_ns, now):
+                self._count("files_filtered")
+                entries.append((key, entry, False))
+                continue
 
-            for project_path in projects:
-                project_name = project_path.name
-                todos_dir = project_path / ".claude" / "work" / "todos"
+            if (
+                not use_cache
+                or entry is None
+                or entry[0] != st.st_mtime_ns
+                or entry[1] != st.st_size
+                or entry[2] != project_name
+            ):
+                todo = self.parse_todo_file(todo_file, project_name)
+                entry = self._index_entry(todo, st) if todo else None
+                self._count("files_parsed")
+            else:
+                self._count("files_indexed")
+            entries.append((key, entry, True))
+
+        return entries
+
+    def _list_todo_files(self, todos_dir: Path) -> List[Tuple[Path, os.stat_result]]:
+        """List *.md files in a todos dir with their stat results."""
+        files = []
+        for name in self._cached_listing(todos_dir, self._list_markdown):
+            path = todos_dir / name
+            try:
+                files.append((path, os.stat(path)))
+            except OSError:
+                continue  # Deleted since the listing was cached
+        return files
+
+    def _index_entry(self, todo: TodoItem, st: os.stat_result) -> Tuple[Any, ...]:
+        """
+        Index entry for a parsed file: (mtime_ns, size, project, title, status,
+        priority, blocks, blocked_by, tags). Age is derived from mtime when read back.
+        """
+        return (
+            st.st_mtime_ns,
+            st.st_size,
+            todo.project,
+            todo.title,
+            todo.status,
+            todo.priority,
+            todo.blocks,
+            todo.blocked_by,
+            todo.tags,
+        )
 
-                for todo_file in todos_dir.glob("*.md"):
-                    todo = self.parse_todo_file(todo_file, project_name)
-                    if todo and todo.status != "complete":
-                        todos.append(todo)
+    def _todo_from_entry(self, path: str, entry: Sequence[Any], now: float) -> TodoItem:
+        mtime_ns, _, project, title, status, priority, blocks, blocked_by, tags = entry
+        return TodoItem(
+            project=project,
+            file_path=Path(path),
+            title=title,
+            status=status,
+            priority=priority,
+            age_days=int((now - mtime_ns / 1e9) / 86400),
+            blocks=list(blocks),
+            blocked_by=list(blocked_by),
+            tags=list(tags),
+        )
 
-            result[org_config.name] = todos
+    def _cache_file(self, org: OrgConfig) -> Path:
+        """Index partition for an org, named after it and keyed by its path."""
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", org.name)
+        path_hash = hashlib.sha1(str(org.path).encode("utf-8")).hexdigest()[:8]
+        suffix = ".json" if self.cache_format == "json" else ".bin"
+        return CACHE_PARTITION_DIR / f"{safe_name}-{path_hash}{suffix}"
 
-        # Save to cache
-        if use_cache:
-            self._save_cache(result)
+    def _load_cache(self, org: OrgConfig) -> Dict[str, Dict[str, Any]]:
+        """
+        Load an org's index: {"files": per-file entries, "dirs": directory
+        listings, "terms": inverted index}. All are empty if the partition is
+        missing, unreadable or outdated.
+        """
+        try:
+            raw = self._cache_file(org).read_bytes()
+        except IOError:
+            raw = b""
+        data = load_index(raw, self.cache_format)
+        if data is None:
+            return {"files": {}, "dirs": {}, "terms": {}}  # Missing or older layout - rebuild
+        return data
+
+    def _save_cache(self, org: OrgConfig, cache: Dict[str, Dict[str, Any]]) -> None:
+        """Save an org's index."""
+        CACHE_PARTITION_DIR.mkdir(parents=True, exist_ok=True)
+        LEGACY_CACHE_FILE.unlink(missing_ok=True)
+
+        cache_file = self._cache_file(org)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            tmp_file.write_bytes(dump_index(cache, self.cache_format))
+            os.replace(tmp_file, cache_file)
+            # Drop the partition in the other encoding after a cache_format switch
+            cache_file.with_suffix(".bin" if cache_file.suffix == ".json" else ".json").unlink(missing_ok=True)
+        except IOError:
+            tmp_file.unlink(missing_ok=True)  # Cache write failure is non-fatal
 
-        return result
 
-    def _load_cache(self) -> Optional[Dict[str, List[TodoItem]]]:
-        """Load from cache if valid."""
-        if not CACHE_FILE.exists():
-            return None
+def dump_index(cache: Dict[str, Dict[str, Any]], cache_format: str = "marshal") -> bytes:
+    """
+    Encode an index partition.
 
-        try:
-            mtime = CACHE_FILE.stat().st_mtime
-            if time.time() - mtime > CACHE_TTL_SECONDS:
+    "marshal": CACHE_MAGIC, CACHE_VERSION and marshal.version, then a marshal
+    of the {"files", "dirs", "terms"} dict. Fast to load and compact (repeated strings
+    such as project names are stored once), but tied to the interpreter's
+    marshal format, which the header guards.
+    "json": {"version": CACHE_VERSION, "files": ..., "dirs": ..., "terms": ...}, human-readable.
+    """
+    if cache_format == "json":
+        return json.dumps({"version": CACHE_VERSION, **cache}).encode("utf-8")
+    header = CACHE_MAGIC + struct.pack("<HH", CACHE_VERSION, marshal.version)
+    return header + marshal.dumps({"files": cache["files"], "dirs": cache["dirs"], "terms": cache["terms"]})
+
+
+def load_index(raw: bytes, cache_format: str = "marshal") -> Optional[Dict[str, Dict[str, Any]]]:
+    """Decode an index partition; None if it is empty, corrupt or from another version."""
+    try:
+        if cache_format == "json":
+            data = json.loads(raw.decode("utf-8")) if raw else None
+            if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
                 return None
+            return {"files": data["files"], "dirs": data["dirs"], "terms": data["terms"]}
 
-            with open(CACHE_FILE, encoding="utf-8") as f:
-                data = json.load(f)
-
-            result: Dict[str, List[TodoItem]] = {}
-            for org_name, todos_data in data.items():
-                todos = []
-                for td in todos_data:
-                    todos.append(TodoItem(
-                        project=td["project"],
-                        file_path=Path(td["file_path"]),
-                        title=td["title"],
-                        status=td["status"],
-                        priority=td["priority"],
-                        age_days=td["age_days"],
-                        blocks=td.get("blocks", []),
-                        blocked_by=td.get("blocked_by", []),
-                        tags=td.get("tags", []),
-                    ))
-                result[org_name] = todos
-
-            return result
-
-        except (json.JSONDecodeError, IOError, KeyError):
+        header_size = len(CACHE_MAGIC) + 4
+        if raw[:len(CACHE_MAGIC)] != CACHE_MAGIC or len(raw) < header_size:
+            return None
+        version, marshal_version = struct.unpack("<HH", raw[len(CACHE_MAGIC):header_size])
+        if version != CACHE_VERSION or marshal_version != marshal.version:
             return None
+        data = marshal.loads(raw[header_size:])
+        return {"files": data["files"], "dirs": data["dirs"], "terms": data["terms"]}
 
-    def _save_cache(self, data: Dict[str, List[TodoItem]]) -> None:
-        """Save aggregated data to cache."""
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    except (ValueError, EOFError, TypeError, KeyError):
+        return None  # json.JSONDecodeError and UnicodeDecodeError are ValueErrors
 
-        cache_data = {}
-        for org_name, todos in data.items():
-            cache_data[org_name] = [todo.to_dict() for todo in todos]
 
-        try:
-            with open(CACHE_FILE, "w", encoding="utf-8") as f:
-                json.dump(cache_data, f)
-        except IOError:
-            pass  # Cache write failure is non-fatal
+def scan_in_order(fn: Callable[[Any], Any], items: List[Any], workers: int) -> Iterator[Any]:
+    """
+    Yield fn(item) for each item, in order, computed on `workers` daemon threads.
+
+    Workers are fed from a queue that runs at most a few items ahead of the
+    consumer, so closing the generator early leaves little work behind. It
+    waits only for the items already in progress; since the threads are
+    daemons, an abandoned scan (e.g. a session-start check past its deadline)
+    never holds up interpreter exit the way a ThreadPoolExecutor's queue would.
+    Exceptions raised by fn are re-raised when their item is reached.
+    """
+    window = workers * 2
+    jobs: "queue.Queue[Optional[Tuple[int, Any]]]" = queue.Queue()
+    results: Dict[int, Tuple[bool, Any]] = {}
+    done = threading.Condition()
+    stop = threading.Event()
+
+    def worker() -> None:
+        while not stop.is_set():
+            job = jobs.get()
+            if job is None:
+                return
+            index, item = job
+            try:
+                result = (True, fn(item))
+            except Exception as e:
+                result = (False, e)
+            with done:
+                results[index] = result
+                done.notify_all()
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(min(workers, len(items)))]
+    for thread in threads:
+        thread.start()
+
+    queued = 0
+    try:
+        for index in range(len(items)):
+            while queued < len(items) and queued < index + window:
+                jobs.put((queued, items[queued]))
+                queued += 1
+            with done:
+                while index not in results:
+                    done.wait()
+                ok, value = results.pop(index)
+            if not ok:
+                raise value
+            yield value
+    finally:
+        stop.set()
+        for _ in threads:
+            jobs.put(None)
+        for thread in threads:
+            thread.join()
+
+
+def update_terms(
+    terms: Dict[str, Dict[str, Dict[str, None]]],
+    old_files: Dict[str, Sequence[Any]],
+    new_files: Dict[str, Sequence[Any]],
+) -> Dict[str, Dict[str, Dict[str, None]]]:
+    """
+    Bring an inverted index from `old_files` to `new_files`, in place.
+
+    `terms` maps field ("project", "priority", "blocker", "tag") -> value ->
+    {path: None}: ordered, JSON- and marshal-friendly sets of file paths.
+    Only entries that were added, changed or removed touch their postings.
+    """
+    def postings(entry: Sequence[Any]) -> Iterator[Tuple[str, str]]:
+        for name, position in TERM_FIELDS:
+            values = entry[position]
+            for value in ([values] if isinstance(values, str) else values):
+                yield name, value
+
+    for path, entry in old_files.items():
+        if new_files.get(path) != entry:
+            for name, value in postings(entry):
+                paths = terms.get(name, {}).get(value)
+                if paths is not None:
+                    paths.pop(path, None)
+                    if not paths:
+                        del terms[name][value]
+    for path, entry in new_files.items():
+        if old_files.get(path) != entry:
+            for name, value in postings(entry):
+                terms.setdefault(name, {}).setdefault(value, {})[path] = None
+    return terms
+
+
+def lookup_paths(terms: Dict[str, Dict[str, Dict[str, None]]], query: TodoQuery) -> Optional[Set[str]]:
+    """
+    Paths matching the query's tag/priority/blocker/project filters: the union
+    of the postings within a field, intersected across fields. None if the
+    query restricts none of them (every path matches).
+    """
+    paths: Optional[Set[str]] = None
+    # Smallest candidate sets first, so intersections stay cheap
+    fields = [
+        set().union(*(terms.get(name, {}).get(value, ()) for value in values))
+        for name, values in query.term_filters()
+    ]
+    for candidates in sorted(fields, key=len):
+        paths = candidates if paths is None else paths & candidates
+    return paths
+
+
+def _collect_inline_tags(text: str, blocks: List[str], blocked_by: List[str]) -> None:
+    """Append [BLOCKS:...] / [BLOCKED-BY:...] values found in `text`."""
+    if "[BLOCK" in text:
+        for kind, value in INLINE_TAG_RE.findall(text):
+            (blocks if kind == "BLOCKS" else blocked_by).append(value.strip())
 
 
 def get_aggregated_summary(
     org_name: Optional[str] = None,
     all_orgs: bool = False,
     use_cache: bool = True,
+    aggregator: Optional[TodoAggregator] = None,
+    query: Optional[TodoQuery] = None,
+    from_index: bool = False,
 ) -> Dict[str, List[TodoItem]]:
     """
     Convenience function to get aggregated todos.
@@ -395,25 +1061,59 @@ def get_aggregated_summary(
         org_name: Specific org to scan (default: default org)
         all_orgs: Scan all orgs in workspace
         use_cache: Use cached results if available
+        aggregator: Aggregator to use (e.g. to read its discovery_stats after)
+        query: Filters and limit to apply while scanning
+        from_index: Answer from the persisted index without scanning
 
     Returns:
         Dict mapping org name to list of TodoItems
     """
-    aggregator = TodoAggregator()
-
-    org = None
-    if org_name:
-        org = aggregator.get_org_by_name(org_name)
-        if not org:
-            raise ValueError(f"Unknown org: {org_name}")
+    aggregator = aggregator or TodoAggregator()
 
     return aggregator.aggregate_todos(
-        org=org,
+        org=_find_org(aggregator, org_name),
         all_orgs=all_orgs,
         use_cache=use_cache,
+        query=query,
+        from_index=from_index,
     )
 
 
+def iter_aggregated_todos(
+    org_name: Optional[str] = None,
+    all_orgs: bool = False,
+    use_cache: bool = True,
+    aggregator: Optional[TodoAggregator] = None,
+    query: Optional[TodoQuery] = None,
+    from_index: bool = False,
+) -> Iterator[Tuple[str, TodoItem]]:
+    """
+    Streaming counterpart of get_aggregated_summary.
+
+    Yields (org name, TodoItem) as projects are scanned. With a query limit
+    the top-ranked items can only be yielded once the scan has finished.
+    Raises ValueError for an unknown org before scanning anything.
+    """
+    aggregator = aggregator or TodoAggregator()
+    orgs = aggregator.select_orgs(_find_org(aggregator, org_name), all_orgs)
+    if from_index:
+        items = aggregator.lookup_todos(orgs, query)
+    else:
+        items = aggregator.iter_todos(orgs, use_cache=use_cache, query=query)
+    if query and query.limit:
+        return iter(top_todos(items, query.limit))
+    return items
+
+
+def _find_org(aggregator: TodoAggregator, org_name: Optional[str]) -> Optional[OrgConfig]:
+    if not org_name:
+        return None
+    org = aggregator.get_org_by_name(org_name)
+    if not org:
+        raise ValueError(f"Unknown org: {org_name}")
+    return org
+
+
 if __name__ == "__main__":
     # Quick test
     aggregator = TodoAggregator()
@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the todo aggregator.
+
+Generates synthetic todo files in a temporary directory and times the parser
+against the original implementation (full read, then separate frontmatter,
+title and inline-tag scans), checking all variants produce the same items.
+
+The cache benchmark builds a synthetic index partition and compares the
+marshal and JSON encodings: file size, load time, and load plus TodoItem
+construction.
+
+The views benchmark formats synthetic todos in every format, comparing the
+previous per-formatter state filtering (uncached state, one list comprehension
+per state) with one shared build_views() pass.
+
+The lookup benchmark answers tag/priority/blocker queries against a synthetic
+index partition, once by building and filtering every todo and once through
+the inverted index.
+
+Usage:
+    python benchmarks.py parse [FILES] [SIZE_KB]    # default: 200 files of 512 KB
+    python benchmarks.py cache [TODOS]              # default: 10000 todos
+    python benchmarks.py views [TODOS]              # default: 50000 todos
+    python benchmarks.py lookup [TODOS]             # default: 10000 todos
+"""
+
+import random
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Add script directory to path for local imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from aggregator import (
+    CACHE_FORMATS,
+    STATES,
+    TodoAggregator,
+    TodoItem,
+    TodoQuery,
+    build_views,
+    dump_index,
+    load_index,
+    lookup_paths,
+    update_terms,
+)
+from formatters import get_formatter
+
+FORMATS = ("terminal", "json", "compact", "overwatch", "project")
+TAGS = ("backend", "perf", "security", "docs", "infra", "frontend", "billing", "auth")
+
+
+# ---------------------------------------------------------------------------
+# Original parser, kept for comparison
+# ---------------------------------------------------------------------------
+
+def legacy_parse_todo_file(aggregator: TodoAggregator, file_path: Path, project_name: str) -> Optional[TodoItem]:
+    try:
+        content = file_path.read_text(encoding="utf-8")
+    except IOError:
+        return None
+
+    try:
+        age_days = int((time.time() - file_path.stat().st_mtime) / 86400)
+    except OSError:
+        age_days = 0
+
+    frontmatter = aggregator._parse_frontmatter(content)
+    title = _legacy_extract_title(content, file_path)
+    inline_blocks, inline_blocked_by = _legacy_parse_inline_tags(content)
+
+    return TodoItem(
+        project=project_name,
+        file_path=file_path,
+        title=title,
+        status=frontmatter.get("status", "pending"),
+        priority=frontmatter.get("priority", "normal"),
+        age_days=age_days,
+        blocks=frontmatter.get("blocks", []) + inline_blocks,
+        blocked_by=frontmatter.get("blocked_by", []) + inline_blocked_by,
+        tags=frontmatter.get("tags", []),
+    )
+
+
+def _legacy_extract_title(content: str, file_path: Path) -> str:
+    if content.startswith("---"):
+        end_marker = content.find("---", 3)
+        if end_marker != -1:
+            content = content[end_marker + 3:].strip()
+    for line in content.split("\n"):
+        line = line.strip()
+        if line.startswith("#"):
+            return line.lstrip("#").strip()
+    return file_path.stem.replace("-", " ").replace("_", " ").title()
+
+
+def _legacy_parse_inline_tags(content: str) -> Tuple[List[str], List[str]]:
+    blocks = [m.group(1).strip() for m in re.finditer(r"\[BLOCKS:([^\]]+)\]", content)]
+    blocked_by = [m.group(1).strip() for m in re.finditer(r"\[BLOCKED-BY:([^\]]+)\]", content)]
+    return blocks, blocked_by
+
+
+# ---------------------------------------------------------------------------
+# Synthetic data
+# ---------------------------------------------------------------------------
+
+LOG_LINE = "2024-01-01T00:00:00Z INFO worker-{n} processed batch {n} in 12ms (queue depth 3)\n"
+
+
+def write_todo_files(directory: Path, count: int, size_kb: int) -> List[Path]:
+    """Write `count` todo files padded with pasted-log lines to about `size_kb` each."""
+    rng = random.Random(42)
+    paths = []
+    for i in range(count):
+        lines = [
+            "---\n",
+            f"status: {rng.choice(['pending', 'ready', 'complete'])}\n",
+            f"priority: {rng.choice(['p1', 'p2', 'normal', 'high'])}\n",
+            "tags: [backend, perf]\n",
+            "---\n",
+            "\n",
+            f"# Investigate slow batch {i}\n",
+            "\n",
+        ]
+        if i % 5 == 0:
+            lines.append("[BLOCKED-BY:infrastructure#vpc]\n")
+        size = sum(len(line) for line in lines)
+        n = 0
+        while size < size_kb * 1024:
+            line = LOG_LINE.format(n=n)
+            lines.append(line)
+            size += len(line)
+            n += 1
+        if i % 7 == 0:
+            lines.append("[BLOCKS:frontend]\n")
+
+        path = directory / f"todo-{i}.md"
+        path.write_text("".join(lines), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def _time(label: str, parse: Callable[[Path], Any], paths: List[Path]) -> List[Any]:
+    start = time.perf_counter()
+    items = [parse(path) for path in paths]
+    elapsed = time.perf_counter() - start
+
+    # Peak allocation for one file, measured separately so tracing doesn't skew timings
+    tracemalloc.start()
+    parse(paths[0])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"  {label:<12} {elapsed * 1000:9.1f}ms  ({elapsed / len(paths) * 1e6:8.1f}us/file)"
+        f"  peak {peak / 1024:8.1f} KB/file"
+    )
+    return items
+
+
+def bench_parse(count: int = 200, size_kb: int = 512) -> int:
+    full = TodoAggregator()
+    full.header_bytes = 0
+    bounded = TodoAggregator()
+    tiny = TodoAggregator()
+    tiny.header_bytes = 64  # Forces the whole-file fallback and many tail chunks
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_todo_files(Path(tmp), count, size_kb)
+        print(f"Parsing {count} todo files of ~{size_kb} KB")
+        results = {
+            "legacy": _time("legacy", lambda p: legacy_parse_todo_file(full, p, "bench"), paths),
+            "single-pass": _time("single-pass", lambda p: full.parse_todo_file(p, "bench"), paths),
+            "header-only": _time(
+                f"header {bounded.header_bytes // 1024}KB", lambda p: bounded.parse_todo_file(p, "bench"), paths
+            ),
+            "tiny-header": [tiny.parse_todo_file(p, "bench") for p in paths],
+        }
+
+    expected = [t.to_dict() for t in results["legacy"]]
+    for name, items in results.items():
+        if [t.to_dict() for t in items] != expected:
+            print(f"MISMATCH: {name} disagrees with the legacy parser")
+            return 1
+    print("  Results match")
+    return 0
+
+
+def synthetic_index(count: int, projects: int = 100) -> Dict[str, Dict[str, Any]]:
+    """An index partition with `count` todo entries spread over `projects` projects."""
+    rng = random.Random(42)
+    aggregator = TodoAggregator()
+    now_ns = time.time_ns()
+    files: Dict[str, Any] = {}
+    dirs: Dict[str, Any] = {}
+    for i in range(count):
+        project = f"project-{i % projects}"
+        todos_dir = f"/home/user/Code/gruntwork/{project}/.claude/work/todos"
+        path = f"{todos_dir}/todo-{i}.md"
+        todo = TodoItem(
+            project=project,
+            file_path=Path(path),
+            title=f"Investigate slow batch {i}",
+            status=rng.choice(["pending", "ready", "complete"]),
+            priority=rng.choice(["p1", "p2", "normal", "high"]),
+            blocked_by=["infrastructure#vpc"] if i % 5 == 0 else [],
+            tags=rng.sample(TAGS, rng.randrange(3)),
+        )
+        st = SimpleNamespace(st_mtime_ns=now_ns - i * 10**9, st_size=2048)
+        files[path] = aggregator._index_entry(todo, st)  # type: ignore[arg-type]
+        dirs.setdefault(todos_dir, (now_ns, now_ns, []))[2].append(f"todo-{i}.md")
+    return {"files": files, "dirs": dirs, "terms": update_terms({}, {}, files)}
+
+
+def bench_cache(count: int = 10000, rounds: int = 5) -> int:
+    aggregator = TodoAggregator()
+    index = synthetic_index(count)
+    print(f"Index partition with {count} todos ({rounds} rounds, best time)")
+
+    decoded = {}
+    for cache_format in CACHE_FORMATS:
+        raw = dump_index(index, cache_format)
+
+        def load_only() -> Any:
+            return load_index(raw, cache_format)
+
+        def load_items() -> List[TodoItem]:
+            data = load_index(raw, cache_format)
+            now = time.time()
+            return [aggregator._todo_from_entry(k, e, now) for k, e in data["files"].items()]
+
+        load = min(_best(load_only) for _ in range(rounds))
+        items = min(_best(load_items) for _ in range(rounds))
+        decoded[cache_format] = [t.to_dict() for t in load_items()]
+        print(
+            f"  {cache_format:<8} {len(raw) / 1024:9.1f} KB  load {load * 1000:7.1f}ms"
+            f"  load+items {items * 1000:7.1f}ms"
+        )
+
+    if decoded["marshal"] != decoded["json"]:
+        print("MISMATCH: encodings decode to different todos")
+        return 1
+    print("  Results match")
+    return 0
+
+
+def _legacy_state(todo: TodoItem) -> str:
+    """TodoItem.state as an uncached property, re-evaluated on every access."""
+    if todo.priority in ("urgent", "p1", "high") or "[URGENT]" in todo.title:
+        return "urgent"
+    if bool(todo.blocked_by) or "[BLOCKED" in todo.title:
+        return "blocked"
+    if todo.age_days > 7:
+        return "stale"
+    return "active"
+
+
+def _legacy_buckets(data: Dict[str, List[TodoItem]]) -> Dict[str, Dict[str, Any]]:
+    """
+    The state filtering the formatters used to do: terminal and json filtered
+    each org for all four states, compact for two (plus an open-status count),
+    project for two more over the org and three per project.
+
+    Returns org name -> {"by_state": state -> todos, "by_project": project ->
+    state -> todos}, comparable with build_views().
+    """
+    result: Dict[str, Dict[str, Any]] = {}
+    for org_name, todos in data.items():
+        buckets: Dict[str, List[TodoItem]] = {}
+        passes = [STATES, STATES, ("urgent", "blocked"), ("urgent", "blocked")]
+        for states in passes:
+            buckets.update({state: [t for t in todos if _legacy_state(t) == state] for state in states})
+        by_project: Dict[str, List[TodoItem]] = {}
+        for todo in todos:
+            by_project.setdefault(todo.project, []).append(todo)
+        project_buckets = {
+            project: {
+                state: [t for t in project_todos if _legacy_state(t) == state]
+                for state in ("urgent", "blocked", "stale")
+            }
+            for project, project_todos in by_project.items()
+        }
+        result[org_name] = {"by_state": buckets, "by_project": project_buckets}
+    return result
+
+
+def synthetic_todos(count: int, orgs: int = 4, projects: int = 100) -> Dict[str, List[TodoItem]]:
+    """`count` TodoItems spread over `orgs` orgs and `projects` projects, with every state represented."""
+    rng = random.Random(42)
+    data: Dict[str, List[TodoItem]] = {f"org-{n}": [] for n in range(orgs)}
+    for i in range(count):
+        data[f"org-{i % orgs}"].append(TodoItem(
+            project=f"project-{i % projects}",
+            file_path=Path(f"/home/user/Code/org-{i % orgs}/todo-{i}.md"),
+            title=rng.choice(["Investigate slow batch", "[URGENT] Rotate keys", "Ship docs"]) + f" {i}",
+            priority=rng.choice(["p1", "p2", "normal", "normal", "normal"]),
+            age_days=rng.randrange(30),
+            blocked_by=["infrastructure#vpc"] if i % 5 == 0 else [],
+        ))
+    return data
+
+
+def bench_views(count: int = 50000, rounds: int = 3) -> int:
+    print(f"Formatting {count} todos in all {len(FORMATS)} formats ({rounds} rounds, best time)")
+
+    def timed(run: Callable[[Dict[str, List[TodoItem]]], Any]) -> float:
+        # Fresh items each round, so cached states start cold
+        times = []
+        for _ in range(rounds):
+            data = synthetic_todos(count)
+            times.append(_best(lambda: run(data)))
+        return min(times)
+
+    def format_all(data: Dict[str, List[TodoItem]], share: bool) -> List[str]:
+        views = build_views(data) if share else None
+        return [get_formatter(name, verbose=True).format(data, views) for name in FORMATS]
+
+    results = [
+        ("bucketing, previous", timed(_legacy_buckets)),
+        ("bucketing, build_views", timed(build_views)),
+        ("all formats, own views", timed(lambda data: format_all(data, share=False))),
+        ("all formats, shared", timed(lambda data: format_all(data, share=True))),
+    ]
+    for label, elapsed in results:
+        print(f"  {label:<24} {elapsed * 1000:8.1f}ms")
+
+    data = synthetic_todos(count)
+    expected = _legacy_buckets(data)
+    for org_name, view in build_views(data).items():
+        legacy = expected[org_name]
+        if any(view.by_state[state] != legacy["by_state"][state] for state in STATES) or any(
+            view.by_project[project][state] != todos
+            for project, states in legacy["by_project"].items()
+            for state, todos in states.items()
+        ):
+            print("MISMATCH: build_views disagrees with the previous state filtering")
+            return 1
+    if format_all(data, share=False) != format_all(data, share=True):
+        print("MISMATCH: shared views change formatter output")
+        return 1
+    print("  Results match")
+    return 0
+
+
+def bench_lookup(count: int = 10000, rounds: int = 5) -> int:
+    aggregator = TodoAggregator()
+    raw = dump_index(synthetic_index(count))
+    queries = {
+        "tag security": TodoQuery(tags={"security"}),
+        "tag security, p1": TodoQuery(tags={"security"}, priorities={"p1"}),
+        "blocked by vpc": TodoQuery(blocked_by={"infrastructure#vpc"}),
+    }
+    load = min(_best(lambda: load_index(raw)) for _ in range(rounds))
+    print(f"Index partition with {count} todos ({rounds} rounds, best time; load {load * 1000:.1f}ms not included)")
+
+    for label, query in queries.items():
+        data = load_index(raw)
+        assert data is not None
+        now = time.time()
+
+        def filter_all() -> List[str]:
+            todos = (aggregator._todo_from_entry(k, e, now) for k, e in data["files"].items())
+            return sorted(str(t.file_path) for t in todos if query.matches(t))
+
+        def lookup() -> List[str]:
+            paths = lookup_paths(data["terms"], query) or set()
+            todos = (aggregator._todo_from_entry(k, data["files"][k], now) for k in paths)
+            return sorted(str(t.file_path) for t in todos if query.matches(t))
+
+        linear = min(_best(filter_all) for _ in range(rounds))
+        indexed = min(_best(lookup) for _ in range(rounds))
+        matches = lookup()
+        if matches != filter_all():
+            print(f"MISMATCH: lookup disagrees with filtering for {label}")
+            return 1
+        print(
+            f"  {label:<18} {len(matches):6} matches  filter all {linear * 1000:7.1f}ms"
+            f"  inverted index {indexed * 1000:7.1f}ms"
+        )
+    print("  Results match")
+    return 0
+
+
+def _best(fn: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    action = sys.argv[1] if len(sys.argv) > 1 else "parse"
+    args = [int(a) for a in sys.argv[2:]]
+
+    if action == "parse":
+        return bench_parse(*args)
+    if action == "cache":
+        return bench_cache(*args)
+    if action == "views":
+        return bench_views(*args)
+    if action == "lookup":
+        return bench_lookup(*args)
+
+    print(__doc__)
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,20 +7,96 @@ Usage:
     python cli.py --all                     # All orgs in workspace
     python cli.py --org gruntwork           # Specific org
     python cli.py --format json             # JSON output
+    python cli.py --format ndjson           # One JSON line per todo, streamed
     python cli.py --format compact          # For Overwatch
     python cli.py --no-cache                # Force fresh scan
     python cli.py --verbose                 # Show all items
+    python cli.py --stats                   # Report index/discovery counters
+    python cli.py --all --workers 8         # Scan projects on 8 threads
+    python cli.py --state urgent,blocked    # Only urgent and blocked todos
+    python cli.py --tag security --limit 5  # Top 5 security todos by priority, then age
+    python cli.py --all --from-index --blocked-by infrastructure#vpc   # Index lookup, no scan
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
+from typing import Set
 
 # Add script directory to path for local imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from aggregator import TodoAggregator, get_aggregated_summary
-from formatters import get_formatter
+from aggregator import (
+    STATES,
+    TodoAggregator,
+    TodoQuery,
+    build_views,
+    get_aggregated_summary,
+    iter_aggregated_todos,
+)
+from formatters import NdjsonFormatter, get_formatter
+
+
+def comma_list(value: str) -> Set[str]:
+    """Argparse type for comma-separated values."""
+    return {item.strip() for item in value.split(",") if item.strip()}
+
+
+def state_list(value: str) -> Set[str]:
+    """Argparse type for comma-separated todo states."""
+    states = comma_list(value)
+    unknown = states - set(STATES)
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"unknown state(s): {', '.join(sorted(unknown))} (choose from {', '.join(STATES)})"
+        )
+    return states
+
+
+def positive_int(value: str) -> int:
+    """Argparse type for counts that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def print_stats(aggregator: TodoAggregator) -> None:
+    """Print the last scan's discovery counters to stderr."""
+    stats = aggregator.discovery_stats
+    print(
+        f"Directories: {stats['dirs_listed']} listed, {stats['dirs_skipped']} skipped (unchanged); "
+        f"files: {stats['files_parsed']} parsed, {stats['files_indexed']} from index, "
+        f"{stats['files_filtered']} filtered out unread",
+        file=sys.stderr,
+    )
+
+
+def stream_ndjson(args: argparse.Namespace, aggregator: TodoAggregator, query: TodoQuery) -> int:
+    """Print one JSON line per todo as projects are scanned."""
+    try:
+        items = iter_aggregated_todos(
+            org_name=args.org,
+            all_orgs=args.all_orgs,
+            use_cache=not args.no_cache,
+            aggregator=aggregator,
+            query=query,
+            from_index=args.from_index,
+        )
+        for line in NdjsonFormatter().iter_lines(items):
+            print(line, flush=True)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except BrokenPipeError:
+        # Reader (e.g. `head`) stopped early; silence the flush at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+
+    if args.stats:
+        print_stats(aggregator)
+    return 0
 
 
 def main() -> int:
@@ -33,7 +109,9 @@ Examples:
     python cli.py --all               # All orgs in workspace
     python cli.py --org gruntwork     # Specific org
     python cli.py --format json       # JSON output
+    python cli.py --format ndjson     # One JSON line per todo
     python cli.py --verbose           # Full item details
+    python cli.py --state stale --older-than 30 --project remail
         """,
     )
 
@@ -53,7 +131,7 @@ Examples:
     parser.add_argument(
         "-f", "--format",
         type=str,
-        choices=["terminal", "json", "compact", "overwatch", "project"],
+        choices=["terminal", "json", "ndjson", "compact", "overwatch", "project"],
         default="terminal",
         help="Output format (default: terminal)",
     )
@@ -76,6 +154,69 @@ Examples:
         help="Show all items (terminal format only)",
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Threads for scanning projects (default: workspace-config.json \"workers\", else 1)",
+    )
+
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print discovery counters (directories listed/skipped, files parsed) to stderr",
+    )
+
+    parser.add_argument(
+        "--state",
+        type=state_list,
+        help=f"Only todos in these states, comma-separated ({', '.join(STATES)})",
+    )
+
+    parser.add_argument(
+        "--tag",
+        type=comma_list,
+        help="Only todos with any of these tags, comma-separated",
+    )
+
+    parser.add_argument(
+        "--project",
+        type=comma_list,
+        help="Only these projects, comma-separated (others are not scanned)",
+    )
+
+    parser.add_argument(
+        "--priority",
+        type=comma_list,
+        help="Only todos with any of these priorities, comma-separated (e.g. p1,high)",
+    )
+
+    parser.add_argument(
+        "--blocked-by",
+        type=comma_list,
+        help="Only todos blocked by any of these, comma-separated (e.g. infrastructure#vpc)",
+    )
+
+    parser.add_argument(
+        "--older-than",
+        type=positive_int,
+        metavar="DAYS",
+        help="Only todos not modified for at least DAYS days (newer files are not read)",
+    )
+
+    parser.add_argument(
+        "--limit",
+        type=positive_int,
+        metavar="N",
+        help="Only the N most important todos: highest priority first, then oldest",
+    )
+
+    parser.add_argument(
+        "--from-index",
+        action="store_true",
+        help="Answer from the todo index without listing directories: indexed files are re-checked "
+             "(one stat each), but todo files created since the last scan are missed",
+    )
+
     parser.add_argument(
         "--list-orgs",
         action="store_true",
@@ -102,29 +243,50 @@ Examples:
             print(f"  {org.name}: {org.path}{default_marker}{sensitive_marker}")
         return 0
 
+    # Determine format (--by-project is shortcut for --format project)
+    format_name = "project" if args.by_project else args.format
+
+    query = TodoQuery(
+        states=args.state or set(),
+        tags=args.tag or set(),
+        projects=args.project or set(),
+        priorities=args.priority or set(),
+        blocked_by=args.blocked_by or set(),
+        older_than_days=args.older_than or 0,
+        limit=args.limit or 0,
+    )
+
+    aggregator = TodoAggregator(workers=args.workers)
+    if format_name == "ndjson":
+        return stream_ndjson(args, aggregator, query)
+
     # Get aggregated data
     try:
         data = get_aggregated_summary(
             org_name=args.org,
             all_orgs=args.all_orgs,
             use_cache=not args.no_cache,
+            aggregator=aggregator,
+            query=query,
+            from_index=args.from_index,
         )
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
 
+    if args.stats:
+        print_stats(aggregator)
+
     # Check if any data
     total_todos = sum(len(todos) for todos in data.values())
     if total_todos == 0:
-        print("No pending todos found.")
+        filtered = args.state or args.tag or args.project or args.priority or args.blocked_by or args.older_than
+        print("No matching todos found." if filtered else "No pending todos found.")
         return 0
 
-    # Determine format (--by-project is shortcut for --format project)
-    format_name = "project" if args.by_project else args.format
-
     # Format and output
     formatter = get_formatter(format_name, verbose=args.verbose)
-    output = formatter.format(data)
+    output = formatter.format(data, build_views(data))
 
     if output:
         print(output)
@@ -5,21 +5,26 @@ Output Formatters for Todo Aggregation.
 Provides multiple output formats:
 - TerminalFormatter: Human-readable with sections
 - JsonFormatter: Machine-readable JSON
+- NdjsonFormatter: One JSON object per todo, streamable
 - CompactFormatter: One-line-per-project for Overwatch
+
+Formatters read state and project buckets from OrgView (see build_views).
+Pass views already built for the same data to share them between formatters;
+otherwise each formatter builds its own.
 """
 
 import json
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
-from aggregator import TodoItem
+from aggregator import STATES, OrgView, TodoItem, build_views
 
 
 class BaseFormatter(ABC):
     """Base class for output formatters."""
 
     @abstractmethod
-    def format(self, data: Dict[str, List[TodoItem]]) -> str:
+    def format(self, data: Dict[str, List[TodoItem]], views: Optional[Dict[str, OrgView]] = None) -> str:
         """Format aggregated todo data."""
         pass
 
@@ -30,7 +35,8 @@ class TerminalFormatter(BaseFormatter):
     def __init__(self, verbose: bool = False):
         self.verbose = verbose
 
-    def format(self, data: Dict[str, List[TodoItem]]) -> str:
+    def format(self, data: Dict[str, List[TodoItem]], views: Optional[Dict[str, OrgView]] = None) -> str:
+        views = build_views(data) if views is None else views
         lines = []
 
         for ws_name, todos in data.items():
@@ -42,11 +48,11 @@ class TerminalFormatter(BaseFormatter):
             lines.append("=" * 50)
             lines.append("")
 
-            # Group by state
-            urgent = [t for t in todos if t.state == "urgent"]
-            blocked = [t for t in todos if t.state == "blocked"]
-            active = [t for t in todos if t.state == "active"]
-            stale = [t for t in todos if t.state == "stale"]
+            view = views[ws_name]
+            urgent = view.by_state["urgent"]
+            blocked = view.by_state["blocked"]
+            active = view.by_state["active"]
+            stale = view.by_state["stale"]
 
             # Urgent section
             if urgent:
@@ -73,13 +79,10 @@ class TerminalFormatter(BaseFormatter):
                         lines.append(f"  [{todo.project}] {todo.title} {age_str}")
                 else:
                     # Summarize by project
-                    by_project: Dict[str, int] = {}
-                    for todo in active:
-                        by_project[todo.project] = by_project.get(todo.project, 0) + 1
-
                     lines.append(f"ACTIVE ({len(active)})")
-                    for project, count in sorted(by_project.items()):
-                        lines.append(f"  [{project}] {count} pending")
+                    for project, buckets in sorted(view.by_project.items()):
+                        if buckets["active"]:
+                            lines.append(f"  [{project}] {len(buckets['active'])} pending")
                 lines.append("")
 
             # Stale section
@@ -109,22 +112,35 @@ class JsonFormatter(BaseFormatter):
     def __init__(self, indent: int = 2):
         self.indent = indent
 
-    def format(self, data: Dict[str, List[TodoItem]]) -> str:
+    def format(self, data: Dict[str, List[TodoItem]], views: Optional[Dict[str, OrgView]] = None) -> str:
+        views = build_views(data) if views is None else views
         output = {}
         for ws_name, todos in data.items():
+            by_state = views[ws_name].by_state
             output[ws_name] = {
                 "total": len(todos),
-                "by_state": {
-                    "urgent": len([t for t in todos if t.state == "urgent"]),
-                    "blocked": len([t for t in todos if t.state == "blocked"]),
-                    "active": len([t for t in todos if t.state == "active"]),
-                    "stale": len([t for t in todos if t.state == "stale"]),
-                },
+                "by_state": {state: len(by_state[state]) for state in STATES},
                 "todos": [todo.to_dict() for todo in todos],
             }
         return json.dumps(output, indent=self.indent)
 
 
+class NdjsonFormatter(BaseFormatter):
+    """
+    Newline-delimited JSON: one object per todo, its org under "org".
+
+    iter_lines() turns todos into lines as the aggregator yields them
+    (see iter_aggregated_todos), so output starts before the scan finishes.
+    """
+
+    def format(self, data: Dict[str, List[TodoItem]], views: Optional[Dict[str, OrgView]] = None) -> str:
+        return "\n".join(self.iter_lines((org_name, todo) for org_name, todos in data.items() for todo in todos))
+
+    def iter_lines(self, items: Iterable[Tuple[str, TodoItem]]) -> Iterator[str]:
+        for org_name, todo in items:
+            yield json.dumps({"org": org_name, **todo.to_dict()})
+
+
 class CompactFormatter(BaseFormatter):
     """
     Compact one-line-per-workspace format for Overwatch.
@@ -132,12 +148,14 @@ class CompactFormatter(BaseFormatter):
     Only shows urgent and blocked items.
     """
 
-    def format(self, data: Dict[str, List[TodoItem]]) -> str:
+    def format(self, data: Dict[str, List[TodoItem]], views: Optional[Dict[str, OrgView]] = None) -> str:
+        views = build_views(data) if views is None else views
         lines = []
 
-        for ws_name, todos in data.items():
-            urgent = [t for t in todos if t.state == "urgent"]
-            blocked = [t for t in todos if t.state == "blocked"]
+        for ws_name in data:
+            view = views[ws_name]
+            urgent = view.by_state["urgent"]
+            blocked = view.by_state["blocked"]
 
             if not urgent and not blocked:
                 continue
@@ -148,8 +166,7 @@ class CompactFormatter(BaseFormatter):
             if blocked:
                 parts.append(f"{len(blocked)} blocked")
 
-            total_active = len([t for t in todos if t.status != "complete"])
-            lines.append(f"[{ws_name}] {', '.join(parts)} ({total_active} total)")
+            lines.append(f"[{ws_name}] {', '.join(parts)} ({view.open_count} total)")
 
             # Show first urgent item if any
             if urgent:
@@ -166,33 +183,52 @@ class OverwatchFormatter(BaseFormatter):
     Shows only if there are urgent/blocked items worth mentioning.
     """
 
-    def format(self, data: Dict[str, List[TodoItem]]) -> str:
-        all_urgent = []
-        all_blocked = []
-
-        for org_name, todos in data.items():
-            for todo in todos:
-                if todo.state == "urgent":
-                    all_urgent.append((org_name, todo))
-                elif todo.state == "blocked":
-                    all_blocked.append((org_name, todo))
+    def __init__(self, limit: int = 20):
+        self.limit = limit  # format_items() stops after this many urgent/blocked items
+
+    def format(self, data: Dict[str, List[TodoItem]], views: Optional[Dict[str, OrgView]] = None) -> str:
+        views = build_views(data) if views is None else views
+        urgent = [todo for org_name in data for todo in views[org_name].by_state["urgent"]]
+        blocked = sum(len(views[org_name].by_state["blocked"]) for org_name in data)
+        return self._render(urgent, blocked, complete=True)
+
+    def format_items(self, items: Iterable[Tuple[str, TodoItem]]) -> str:
+        """
+        Format from a stream of (org name, todo), e.g. TodoAggregator.iter_todos().
+
+        Stops reading once more than `limit` urgent/blocked items are found;
+        counts are then shown as lower bounds ("21+").
+        """
+        urgent: List[TodoItem] = []
+        blocked = 0
+        for _, todo in items:
+            if todo.state == "urgent":
+                urgent.append(todo)
+            elif todo.state == "blocked":
+                blocked += 1
+            else:
+                continue
+            if len(urgent) + blocked > self.limit:
+                return self._render(urgent, blocked, complete=False)
+        return self._render(urgent, blocked, complete=True)
 
-        if not all_urgent and not all_blocked:
+    def _render(self, urgent: List[TodoItem], blocked: int, complete: bool) -> str:
+        if not urgent and not blocked:
             return ""
 
+        more = "" if complete else "+"
         lines = []
 
-        if all_urgent:
-            lines.append(f"{len(all_urgent)} urgent todo(s) across projects")
+        if urgent:
+            lines.append(f"{len(urgent)}{more} urgent todo(s) across projects")
             # Show top 2
-            for org_name, todo in all_urgent[:2]:
+            for todo in urgent[:2]:
                 lines.append(f"   [{todo.project}] {todo.title}")
 
-        if all_blocked:
-            lines.append(f"{len(all_blocked)} blocked todo(s) need attention")
+        if blocked:
+            lines.append(f"{blocked}{more} blocked todo(s) need attention")
 
-        if all_urgent or all_blocked:
-            lines.append("   Run /run-todos-summary for details")
+        lines.append("   Run /run-todos-summary for details")
 
         return "\n".join(lines)
 
@@ -207,7 +243,8 @@ class ProjectFormatter(BaseFormatter):
     def __init__(self, verbose: bool = False):
         self.verbose = verbose
 
-    def format(self, data: Dict[str, List[TodoItem]]) -> str:
+    def format(self, data: Dict[str, List[TodoItem]], views: Optional[Dict[str, OrgView]] = None) -> str:
+        views = build_views(data) if views is None else views
         lines = []
 
         for org_name, todos in data.items():
@@ -219,27 +256,24 @@ class ProjectFormatter(BaseFormatter):
             lines.append("=" * 50)
             lines.append("")
 
-            # Group by project
-            by_project: Dict[str, List[TodoItem]] = {}
-            for todo in todos:
-                if todo.project not in by_project:
-                    by_project[todo.project] = []
-                by_project[todo.project].append(todo)
+            view = views[org_name]
+            by_project = view.by_project
 
             # Sort projects: those with urgent items first, then by todo count
-            def project_sort_key(item):
-                project_name, project_todos = item
-                has_urgent = any(t.state == "urgent" for t in project_todos)
-                has_blocked = any(t.state == "blocked" for t in project_todos)
-                return (not has_urgent, not has_blocked, -len(project_todos))
+            def project_sort_key(project_name):
+                buckets = by_project[project_name]
+                total = sum(len(bucket) for bucket in buckets.values())
+                return (not buckets["urgent"], not buckets["blocked"], -total)
 
-            sorted_projects = sorted(by_project.items(), key=project_sort_key)
+            sorted_projects = sorted(by_project, key=project_sort_key)
 
-            for project_name, project_todos in sorted_projects:
-                # Count by state
-                urgent_count = len([t for t in project_todos if t.state == "urgent"])
-                blocked_count = len([t for t in project_todos if t.state == "blocked"])
-                stale_count = len([t for t in project_todos if t.state == "stale"])
+            for project_name in sorted_projects:
+                # Urgent first, then blocked, then active, then stale
+                sorted_todos = view.project_todos(project_name)
+                buckets = by_project[project_name]
+                urgent_count = len(buckets["urgent"])
+                blocked_count = len(buckets["blocked"])
+                stale_count = len(buckets["stale"])
 
                 # Project header with summary
                 status_parts = []
@@ -251,11 +285,7 @@ class ProjectFormatter(BaseFormatter):
                     status_parts.append(f"{stale_count} stale")
 
                 status_str = f" - {', '.join(status_parts)}" if status_parts else ""
-                lines.append(f"{project_name} ({len(project_todos)} todos){status_str}")
-
-                # Sort todos: urgent first, then blocked, then active, then stale
-                state_order = {"urgent": 0, "blocked": 1, "active": 2, "stale": 3}
-                sorted_todos = sorted(project_todos, key=lambda t: state_order.get(t.state, 4))
+                lines.append(f"{project_name} ({len(sorted_todos)} todos){status_str}")
 
                 # Show todos
                 if self.verbose:
@@ -282,8 +312,8 @@ class ProjectFormatter(BaseFormatter):
 
             # Summary
             total = len(todos)
-            urgent_total = len([t for t in todos if t.state == "urgent"])
-            blocked_total = len([t for t in todos if t.state == "blocked"])
+            urgent_total = len(view.by_state["urgent"])
+            blocked_total = len(view.by_state["blocked"])
 
             if urgent_total or blocked_total:
                 summary_parts = []
@@ -307,7 +337,7 @@ def get_formatter(format_name: str, verbose: bool = False) -> BaseFormatter:
     Factory function to get formatter by name.
 
     Args:
-        format_name: One of "terminal", "json", "compact", "overwatch", "project"
+        format_name: One of "terminal", "json", "ndjson", "compact", "overwatch", "project"
         verbose: Enable verbose output (for terminal/project format)
 
     Returns:
@@ -316,6 +346,7 @@ def get_formatter(format_name: str, verbose: bool = False) -> BaseFormatter:
     formatters = {
         "terminal": lambda: TerminalFormatter(verbose=verbose),
         "json": lambda: JsonFormatter(),
+        "ndjson": lambda: NdjsonFormatter(),
         "compact": lambda: CompactFormatter(),
         "overwatch": lambda: OverwatchFormatter(),
         "project": lambda: ProjectFormatter(verbose=verbose),
@@ -362,12 +393,13 @@ if __name__ == "__main__":
     ]
 
     data = {"gruntwork": sample_todos}
+    views = build_views(data)
 
     print("=== Terminal Format ===")
-    print(TerminalFormatter().format(data))
+    print(TerminalFormatter().format(data, views))
 
     print("\n=== Compact Format ===")
-    print(CompactFormatter().format(data))
+    print(CompactFormatter().format(data, views))
 
     print("\n=== Overwatch Format ===")
-    print(OverwatchFormatter().format(data))
+    print(OverwatchFormatter().format(data, views))